@@ -45,6 +45,7 @@ LOGOUT_REDIRECT_URL = "home"
 # Middleware settings
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "faqs.middleware.AnonymousPageCacheMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -92,7 +93,7 @@ DATABASES = {
 # Cache configuration
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "faqs.cache_backends.TwoTierRedisCache",
         "LOCATION": REDIS_URL,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
@@ -100,6 +101,8 @@ CACHES = {
                 "max_connections": 100,
                 "decode_responses": False,
             },
+            "COMPRESSOR": "faqs.compressors.ZlibCompressor",
+            "COMPRESS_MIN_LENGTH": 1024,  # bytes
         },
     }
 }
@@ -130,8 +133,37 @@ CKEDITOR_5_CONFIGS = {
 # FAQ settings
 FAQ_SETTINGS = {
     "CACHE_TIMEOUT": 60 * 60,  # 1 hour
+    # In-process cache in front of Redis for faq:* keys; None disables it
+    "LOCAL_CACHE": {"MAX_ENTRIES": 1000, "TIMEOUT": 30, "PREFIXES": ["faq:"]},
+    "CACHE_STALE_TIMEOUT": 60 * 60,  # served stale while refreshing
+    "CACHE_EARLY_REFRESH_BETA": 1.0,  # 0 disables probabilistic early refresh
+    "CACHE_GZIP_MIN_SIZE": 1024,  # bytes; cached API responses are pre-compressed
+    "PAGE_CACHE_TIMEOUT": 60 * 10,  # anonymous faq_list pages; None disables
+    "CACHE_CONTROL_MAX_AGE": 60,  # seconds browsers may reuse anonymous responses
+    "SURROGATE_MAX_AGE": 60 * 60 * 24,  # seconds a reverse proxy may keep them
+    # Purges the reverse proxy or CDN by surrogate key when FAQs change, e.g.
+    # {"BACKEND": "faqs.purge.HTTPPurgeBackend", "OPTIONS": {"URL": "..."}}
+    "PURGE_BACKEND": {"BACKEND": "faqs.purge.NullPurgeBackend", "OPTIONS": {}},
     "LANGUAGES": ["en", "hi", "bn"],
     "TRANSLATION_CACHE_TIMEOUT": 60 * 60 * 24,  # 24 hours
+    "TRANSLATION_BACKEND": {
+        "BACKEND": "faqs.translation.GoogleTransBackend",
+        "OPTIONS": {},
+    },
+    # Optional ordered list of backend dicts; calls are hedged across them
+    "TRANSLATION_BACKENDS": [],
+    "TRANSLATION_HEDGE": {"PERCENTILE": 95, "DEFAULT_DELAY": 0.5, "MIN_SAMPLES": 20},
+    "TRANSLATION_CONCURRENCY": 8,
+    "TRANSLATION_DEADLINE": 10,  # seconds
+    "TRANSLATION_MAX_CHUNK_SIZE": 1000,  # characters per translated segment
+    "TRANSLATION_SENTENCE_MEMORY": True,  # share translations per sentence
+    "SINGLE_FLIGHT_LOCK_TIMEOUT": 30,  # seconds, bounds crashed lock holders
+    "SINGLE_FLIGHT_WAIT": 2,  # seconds before falling back to English
+    "TRANSLATION_FAILURE_BACKOFF": 30,  # seconds, doubles per failure
+    "TRANSLATION_FAILURE_MAX_BACKOFF": 60 * 60,
+    "CIRCUIT_BREAKER_THRESHOLD": 5,  # consecutive failures
+    "CIRCUIT_BREAKER_RESET_TIMEOUT": 30,  # seconds
+    "TRANSLATION_RATE_LIMIT": {"RATE": 5, "BURST": 20},  # backend calls per second
 }
 
 # Security settings
@@ -1,8 +1,8 @@
 from django.contrib import admin
-from django.core.cache import cache
 from django.utils.html import format_html, strip_tags
 from django.utils.translation import gettext_lazy as _
 
+from .caching import invalidate_faq_cache
 from .models import FAQ
 
 
@@ -60,10 +60,8 @@ class FAQAdmin(admin.ModelAdmin):
         """Optimize query performance"""
         return super().get_queryset(request).select_related()
 
-    def save_model(self, request, obj, form, change):
-        """Clear cache on save"""
-        super().save_model(request, obj, form, change)
-        supported_langs = ["en", "hi", "bn"]
-        for lang in supported_langs:
-            cache_key = obj._get_cache_key("content", lang)
-            cache.delete(cache_key)
+    def delete_queryset(self, request, queryset):
+        """Clear cache for bulk deletes, which bypass ``FAQ.delete``"""
+        faq_ids = list(queryset.values_list("pk", flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_faq_cache(faq_ids=faq_ids)
@@ -0,0 +1,345 @@
+from collections import OrderedDict
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django_redis.cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "faq:local_cache:invalidate"
+
+DEFAULT_LOCAL_CACHE = {"MAX_ENTRIES": 1000, "TIMEOUT": 30, "PREFIXES": ["faq:"]}
+
+
+class FrequencySketch:
+    """
+    Count-min sketch estimating how often keys were requested recently.
+
+    All counters are halved once ``sample_size`` increments have been
+    recorded, so old popularity fades out.
+    """
+
+    depth = 4
+
+    def __init__(self, width, sample_size):
+        self.width = width
+        self.sample_size = sample_size
+        self.seeds = [random.getrandbits(32) for _ in range(self.depth)]
+        self.table = [[0] * width for _ in range(self.depth)]
+        self.additions = 0
+
+    def _indexes(self, key):
+        return [hash((seed, key)) % self.width for seed in self.seeds]
+
+    def increment(self, key):
+        for row, index in zip(self.table, self._indexes(key)):
+            row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = [[count // 2 for count in row] for row in self.table]
+            self.additions //= 2
+
+    def estimate(self, key):
+        return min(row[index] for row, index in zip(self.table, self._indexes(key)))
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with a TTL and TinyLFU admission.
+
+    When the cache is full a new key only replaces the least recently used
+    entry if it has been requested more often, so one-off keys cannot flush
+    out the popular ones. Values are shared between threads and must be
+    treated as read-only.
+
+    ``generation`` changes with every write, delete or clear, so a value read
+    from Redis can be stored with ``fill`` only if nothing was invalidated
+    while it was being fetched.
+    """
+
+    def __init__(self, max_entries=1000, timeout=30):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.sketch = FrequencySketch(max(max_entries * 4, 64), max_entries * 10)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key):
+        """Return ``(found, value)`` for a key."""
+        with self._lock:
+            self.sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self.generation += 1
+            self._put(key, value, timeout)
+
+    def fill(self, key, value, generation):
+        """Store a value read from Redis unless the cache changed since ``generation``."""
+        with self._lock:
+            if generation == self.generation:
+                self._put(key, value, None)
+
+    def _put(self, key, value, timeout):
+        if timeout is None or timeout is DEFAULT_TIMEOUT or timeout > self.timeout:
+            timeout = self.timeout
+        if timeout <= 0:
+            self._entries.pop(key, None)
+            return
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            victim = next(iter(self._entries))
+            if self.sketch.estimate(key) <= self.sketch.estimate(victim):
+                return
+            del self._entries[victim]
+        self._entries[key] = (value, time.monotonic() + timeout)
+        self._entries.move_to_end(key)
+
+    def delete(self, key):
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_local_cache = None
+_local_cache_lock = threading.Lock()
+_listener = None
+_node_id = uuid.uuid4().hex
+
+
+def get_local_cache():
+    """Return the process-wide L1 cache, or ``None`` when it is disabled."""
+    global _local_cache
+    config = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "LOCAL_CACHE", DEFAULT_LOCAL_CACHE
+    )
+    if not config:
+        return None
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache(
+                    config.get("MAX_ENTRIES", DEFAULT_LOCAL_CACHE["MAX_ENTRIES"]),
+                    config.get("TIMEOUT", DEFAULT_LOCAL_CACHE["TIMEOUT"]),
+                )
+    return _local_cache
+
+
+def _listen(redis_client):
+    """Drop L1 entries written or invalidated by other processes."""
+    while True:
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                local_cache = get_local_cache()
+                payload = json.loads(message["data"])
+                if local_cache is None or payload["node"] == _node_id:
+                    continue
+                if payload.get("clear"):
+                    local_cache.clear()
+                for key in payload.get("keys", []):
+                    local_cache.delete(key)
+        except Exception as e:
+            logger.error(f"Local cache invalidation listener failed: {str(e)}")
+        # Messages may have been missed while disconnected
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            local_cache.clear()
+        time.sleep(1)
+
+
+class TwoTierRedisCache(RedisCache):
+    """
+    django-redis cache with an in-process L1 for hot FAQ keys.
+
+    Keys starting with one of ``FAQ_SETTINGS["LOCAL_CACHE"]["PREFIXES"]`` are
+    kept in a bounded local cache for up to ``TIMEOUT`` seconds. Every
+    write, delete or increment of such a key is published over Redis pub/sub
+    so the other processes drop their local copies right away. Lock keys are
+    never cached locally.
+    """
+
+    def _local_key(self, key, version):
+        local_cache = get_local_cache()
+        if local_cache is None:
+            return None, None
+        prefixes = tuple(
+            getattr(settings, "FAQ_SETTINGS", {})
+            .get("LOCAL_CACHE", DEFAULT_LOCAL_CACHE)
+            .get("PREFIXES", DEFAULT_LOCAL_CACHE["PREFIXES"])
+        )
+        key = str(key)
+        if not key.startswith(prefixes) or key.endswith((":lock", ":refreshing")):
+            return None, None
+        self._start_listener()
+        return local_cache, self.make_key(key, version)
+
+    def _start_listener(self):
+        global _listener
+        if _listener is None:
+            with _local_cache_lock:
+                if _listener is None:
+                    _listener = threading.Thread(
+                        target=_listen,
+                        args=(self.client.get_client(write=False),),
+                        name="local-cache-invalidation",
+                        daemon=True,
+                    )
+                    _listener.start()
+
+    def _publish(self, keys=(), clear=False):
+        payload = {"node": _node_id, "keys": list(keys), "clear": clear}
+        try:
+            self.client.get_client().publish(INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:
+            logger.error(f"Publishing local cache invalidation failed: {str(e)}")
+
+    def _invalidate(self, data, version=None, timeout=None):
+        """Update or drop local copies and tell other processes to drop theirs."""
+        published = []
+        for key in data:
+            local_cache, local_key = self._local_key(key, version)
+            if local_cache is None:
+                continue
+            if isinstance(data, dict):
+                local_cache.set(local_key, data[key], timeout)
+            else:
+                local_cache.delete(local_key)
+            published.append(local_key)
+        if published:
+            self._publish(published)
+
+    def get(self, key, default=None, version=None, client=None):
+        local_cache, local_key = self._local_key(key, version)
+        if local_cache is None:
+            return super().get(key, default, version, client)
+        found, value = local_cache.get(local_key)
+        if found:
+            return value
+        # An invalidation arriving during the fetch must not be overwritten
+        generation = local_cache.generation
+        value = super().get(key, None, version, client)
+        if value is None:
+            return default
+        local_cache.fill(local_key, value, generation)
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        result = {}
+        remote = []
+        for key in keys:
+            local_cache, local_key = self._local_key(key, version)
+            found, value = local_cache.get(local_key) if local_cache else (False, None)
+            if found:
+                result[key] = value
+            else:
+                remote.append(key)
+        if remote:
+            local_cache = get_local_cache()
+            generation = local_cache.generation if local_cache is not None else None
+            fetched = super().get_many(remote, version=version, client=client)
+            for key, value in fetched.items():
+                local_cache, local_key = self._local_key(key, version)
+                if local_cache is not None:
+                    local_cache.fill(local_key, value, generation)
+            result.update(fetched)
+        return result
+
+    def set(
+        self,
+        key,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        version=None,
+        client=None,
+        nx=False,
+        xx=False,
+    ):
+        result = super().set(
+            key, value, timeout=timeout, version=version, client=client, nx=nx, xx=xx
+        )
+        if result:
+            self._invalidate({key: value}, version, timeout)
+        return result
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().add(
+            key, value, timeout=timeout, version=version, client=client
+        )
+        if result:
+            self._invalidate({key: value}, version, timeout)
+        return result
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        result = super().set_many(data, timeout=timeout, version=version, client=client)
+        self._invalidate(dict(data), version, timeout)
+        return result
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        result = super().delete(key, version=version, prefix=prefix, client=client)
+        self._invalidate([key], version)
+        return result
+
+    def delete_many(self, keys, version=None, client=None):
+        keys = list(keys)
+        result = super().delete_many(keys, version=version, client=client)
+        self._invalidate(keys, version)
+        return result
+
+    def incr(self, key, delta=1, version=None, client=None, ignore_key_check=False):
+        result = super().incr(
+            key,
+            delta=delta,
+            version=version,
+            client=client,
+            ignore_key_check=ignore_key_check,
+        )
+        self._invalidate([key], version)
+        return result
+
+    def decr(self, key, delta=1, version=None, client=None):
+        result = super().decr(key, delta=delta, version=version, client=client)
+        self._invalidate([key], version)
+        return result
+
+    def clear(self):
+        result = super().clear()
+        local_cache = get_local_cache()
+        if local_cache is not None:
+            local_cache.clear()
+            self._publish(clear=True)
+        return result
+
+
+@receiver(setting_changed)
+def reset_local_cache(*, setting, **kwargs):
+    """Drop the L1 cache when FAQ settings change (e.g. in tests)."""
+    global _local_cache
+    if setting == "FAQ_SETTINGS":
+        _local_cache = None
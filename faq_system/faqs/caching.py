@@ -0,0 +1,363 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+import logging
+import math
+import random
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+
+from .purge import (
+    faq_surrogate_key,
+    lang_surrogate_key,
+    LIST_SURROGATE_KEY,
+    purge_surrogate_keys,
+)
+
+logger = logging.getLogger(__name__)
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache")
+
+
+def _version_key(namespace):
+    return f"faq:version:{namespace}"
+
+
+def get_versions(namespaces, create=True):
+    """
+    Return the current generation of each cache namespace.
+
+    Missing counters start from the current time in milliseconds rather than
+    from one, so a counter lost to eviction never brings back entries that
+    were written under an older generation. With ``create=False`` namespaces
+    without a counter are left out instead.
+    """
+    keys = {namespace: _version_key(namespace) for namespace in namespaces}
+    versions = cache.get_many(keys.values())
+    result = {}
+    for namespace, key in keys.items():
+        if key not in versions:
+            if not create:
+                continue
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            versions[key] = cache.get(key)
+        result[namespace] = versions[key]
+    return result
+
+
+def versioned_key(key, *namespaces, create=True):
+    """
+    Build a cache key that includes the generation of each namespace.
+
+    Bumping any of the namespaces moves readers to a new key; entries under
+    the old key are never read again and expire through their timeout. With
+    ``create=False`` missing counters are not created and ``None`` is
+    returned instead.
+    """
+    return versioned_keys({key: namespaces}, create).get(key)
+
+
+def versioned_keys(namespaces_by_key, create=True):
+    """Build several versioned keys with a single version lookup."""
+    versions = get_versions(
+        {
+            namespace
+            for namespaces in namespaces_by_key.values()
+            for namespace in namespaces
+        },
+        create,
+    )
+    return {
+        key: f"{key}:v{'.'.join(str(versions[namespace]) for namespace in namespaces)}"
+        for key, namespaces in namespaces_by_key.items()
+        if all(namespace in versions for namespace in namespaces)
+    }
+
+
+def _modified_key(namespace):
+    return f"faq:modified:{namespace}"
+
+
+def bump_versions(namespaces):
+    """Invalidate every key built from the given namespaces."""
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No counter yet, so nothing can have been cached under it
+            get_versions([namespace])
+    if namespaces:
+        now = time.time()
+        cache.set_many(
+            {_modified_key(namespace): now for namespace in namespaces}, timeout=None
+        )
+
+
+def get_last_modified(namespaces):
+    """
+    Return when any of the namespaces was last invalidated.
+
+    Returns:
+        datetime: The latest invalidation time, or ``None`` if unknown
+    """
+    modified = cache.get_many([_modified_key(namespace) for namespace in namespaces])
+    if not modified:
+        return None
+    return datetime.fromtimestamp(max(modified.values()), tz=timezone.utc)
+
+
+def faq_namespace(faq_id):
+    return f"faq:{faq_id}"
+
+
+def lang_namespace(lang):
+    """
+    Return the namespace of a language.
+
+    Languages missing from ``FAQ_SETTINGS["LANGUAGES"]`` share one namespace,
+    so arbitrary ``lang`` parameters cannot create a counter each.
+    """
+    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "LANGUAGES", ["en", "hi", "bn"]
+    )
+    return f"lang:{lang}" if lang in languages else "lang:other"
+
+
+def _tag_key(tag):
+    return f"faq:tag:{tag}"
+
+
+def _get_redis():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection("default")
+
+
+def tag_keys(keys, tags, timeout):
+    """
+    Record cache keys in a Redis set per tag so they can be deleted together.
+
+    Each set expires with the entries last added to it. Tagging is best
+    effort: without Redis entries are still invalidated through namespace
+    versions and only age out later. Only FAQ and list namespaces make
+    useful tags; language namespaces are not invalidated on writes, so their
+    sets would collect every versioned key without ever being deleted.
+    """
+    tag_many({key: tags for key in keys}, timeout)
+
+
+def tag_many(tags_by_key, timeout):
+    """Record each key under its own tags in a single round trip."""
+    keys_by_tag = {}
+    for key, tags in tags_by_key.items():
+        for tag in tags:
+            keys_by_tag.setdefault(tag, []).append(key)
+    if not keys_by_tag:
+        return
+    try:
+        client = _get_redis()
+        pipeline = client.pipeline()
+        for tag, keys in keys_by_tag.items():
+            tag_key = cache.make_key(_tag_key(tag))
+            pipeline.sadd(tag_key, *keys)
+            if timeout is not None:
+                pipeline.expire(tag_key, int(timeout) + 1)
+        pipeline.execute()
+    except NotImplementedError:
+        pass
+    except Exception as e:
+        logger.error(f"Tagging cache keys failed: {str(e)}")
+
+
+def delete_tagged(tags):
+    """Delete every cache entry recorded under the given tags."""
+    if not tags:
+        return
+    try:
+        client = _get_redis()
+        tag_keys = [cache.make_key(_tag_key(tag)) for tag in tags]
+        pipeline = client.pipeline()
+        for tag_key in tag_keys:
+            pipeline.smembers(tag_key)
+        members = set().union(*pipeline.execute())
+        # Deleting through the cache also drops in-process copies
+        cache.delete_many([member.decode("utf-8") for member in members])
+        client.delete(*tag_keys)
+    except NotImplementedError:
+        pass
+    except Exception as e:
+        logger.error(f"Deleting tagged cache keys failed: {str(e)}")
+
+
+def set_tagged(key, value, timeout, tags=()):
+    """Store a value and record its key under ``tags``."""
+    cache.set(key, value, timeout=timeout)
+    tag_keys([key], tags, timeout)
+
+
+def _invalidate(namespaces, surrogate_keys):
+    bump_versions(namespaces)
+    delete_tagged(namespaces)
+    purge_surrogate_keys(surrogate_keys)
+
+
+def invalidate_faq_cache(faq_ids=(), languages=(), lists=True):
+    """
+    Invalidate cached FAQ data once the current transaction commits.
+
+    Deferring to the commit keeps readers from caching rows from before
+    it under the new generations. The namespace generations are then bumped,
+    so an entry written concurrently with the invalidation is not read
+    either, entries tagged with the namespaces are deleted and responses
+    cached by a proxy are purged by surrogate key. ``FAQ.save`` and
+    ``FAQ.delete`` call this, so views only need to for queryset writes that
+    bypass them.
+
+    Args:
+        faq_ids: FAQs whose detail and content entries are stale
+        languages: Languages whose entries are stale for every FAQ
+        lists (bool): Whether the FAQ lists are stale
+    """
+    namespaces = [faq_namespace(faq_id) for faq_id in faq_ids]
+    namespaces += [lang_namespace(lang) for lang in languages]
+    if lists:
+        namespaces.append("list")
+    keys = [faq_surrogate_key(faq_id) for faq_id in faq_ids]
+    keys += [lang_surrogate_key(lang) for lang in languages]
+    if lists:
+        keys.append(LIST_SURROGATE_KEY)
+    transaction.on_commit(partial(_invalidate, namespaces, keys))
+
+
+def set_with_stale(key, value, timeout, tags=(), delta=0):
+    """
+    Store a value that stays fresh for ``timeout`` seconds.
+
+    The cache entry itself outlives the soft expiry by ``CACHE_STALE_TIMEOUT``
+    seconds so it can still be served while being refreshed. ``delta`` is the
+    time in seconds the value took to compute.
+    """
+    stale_timeout = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "CACHE_STALE_TIMEOUT", 60 * 60
+    )
+    entry = {"value": value, "fresh_until": time.time() + timeout, "delta": delta}
+    set_tagged(key, entry, timeout + stale_timeout, tags)
+
+
+def should_refresh(entry, now=None):
+    """
+    Decide whether a cached entry should be recomputed now.
+
+    Implements probabilistic early expiration (XFetch): the closer an entry
+    is to its soft expiry and the longer it took to compute, the likelier a
+    reader is to refresh it early, so refreshes of hot keys are spread out
+    instead of all happening at the expiry time. ``CACHE_EARLY_REFRESH_BETA``
+    scales how early refreshes happen; 0 disables them.
+    """
+    beta = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_EARLY_REFRESH_BETA", 1.0)
+    now = time.time() if now is None else now
+    # 1 - random() lies in (0, 1], so the logarithm is finite and <= 0
+    early = entry.get("delta", 0) * beta * -math.log(1 - random.random())
+    return now + early >= entry["fresh_until"]
+
+
+def _refresh(key, compute, timeout, tags):
+    try:
+        started = time.monotonic()
+        value = compute()
+        set_with_stale(key, value, timeout, tags, time.monotonic() - started)
+    except Exception as e:
+        logger.error(f"Background refresh of {key} failed: {str(e)}")
+    finally:
+        cache.delete(f"{key}:refreshing")
+        close_old_connections()
+
+
+def schedule_refresh(key, compute, timeout, tags=()):
+    """Recompute an entry in the background unless a refresh is already running."""
+    if cache.add(f"{key}:refreshing", True, timeout=60):
+        _refresh_executor.submit(_refresh, key, compute, timeout, tags)
+
+
+def single_flight(key, compute, load, store, fallback=None):
+    """
+    Compute the value stored under ``key`` at most once across all processes.
+
+    The first caller takes a Redis lock and computes and stores the value.
+    Concurrent callers poll ``load`` for the result until
+    ``SINGLE_FLIGHT_WAIT`` seconds have passed and then call ``fallback``
+    (or compute the value themselves when there is none). The lock expires
+    after ``SINGLE_FLIGHT_LOCK_TIMEOUT`` seconds, so a crashed holder cannot
+    block others for longer than that.
+    """
+    faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+    lock_key = f"{key}:lock"
+    lock_timeout = faq_settings.get("SINGLE_FLIGHT_LOCK_TIMEOUT", 30)
+    poll_interval = faq_settings.get("SINGLE_FLIGHT_POLL_INTERVAL", 0.05)
+    deadline = time.monotonic() + faq_settings.get("SINGLE_FLIGHT_WAIT", 2)
+
+    while True:
+        token = uuid.uuid4().hex
+        if cache.add(lock_key, token, timeout=lock_timeout):
+            try:
+                value = compute()
+                store(value)
+                return value
+            finally:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+
+        while time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            value = load()
+            if value is not None:
+                return value
+            if cache.get(lock_key) is None:
+                # The holder finished without storing or its lock expired
+                break
+        else:
+            return (fallback or compute)()
+
+
+def get_or_set_stale(key, compute, timeout, fallback=None, tags=()):
+    """
+    Get a cached value, serving stale entries while they are recomputed.
+
+    Entries are fresh for ``timeout`` seconds and then kept for another
+    ``CACHE_STALE_TIMEOUT`` seconds. A stale hit, or a fresh hit picked by
+    ``should_refresh`` shortly before expiry, returns the cached value right
+    away and schedules a single background refresh; a full miss computes the
+    value inline through ``single_flight``. Stored entries are recorded
+    under ``tags``.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        started = time.monotonic()
+
+        def timed_compute():
+            nonlocal started
+            started = time.monotonic()
+            return compute()
+
+        def load():
+            entry = cache.get(key)
+            return None if entry is None else entry["value"]
+
+        return single_flight(
+            key,
+            timed_compute,
+            load,
+            lambda value: set_with_stale(
+                key, value, timeout, tags, time.monotonic() - started
+            ),
+            fallback,
+        )
+
+    if should_refresh(entry):
+        schedule_refresh(key, compute, timeout, tags)
+    return entry["value"]
@@ -0,0 +1,21 @@
+from django_redis.compressors.zlib import ZlibCompressor as BaseZlibCompressor
+
+
+class ZlibCompressor(BaseZlibCompressor):
+    """
+    django-redis' zlib compressor with a configurable threshold.
+
+    Values of at most ``COMPRESS_MIN_LENGTH`` bytes are stored as is, since
+    compressing them costs more CPU than it saves in transfer, and so are
+    values zlib cannot shrink, such as entries holding a gzip body.
+    ``COMPRESS_LEVEL`` sets the zlib level.
+    """
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.min_length = options.get("COMPRESS_MIN_LENGTH", 1024)
+        self.preset = options.get("COMPRESS_LEVEL", self.preset)
+
+    def compress(self, value):
+        compressed = super().compress(value)
+        return compressed if len(compressed) < len(value) else value
@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .caching import invalidate_faq_cache
+from .models import FAQTranslation, TranslationJob
+
+logger = logging.getLogger(__name__)
+
+
+def _process_language(lang, jobs):
+    """
+    Translate the FAQs of a group of claimed jobs into one language.
+
+    Cached entries of the finished FAQs are invalidated afterwards, since
+    they may hold the English fallback served while translation was failing.
+    """
+    faqs = [job.faq for job in jobs]
+    FAQTranslation.objects.translate_missing(faqs, [lang])
+    max_attempts = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "TRANSLATION_JOB_MAX_ATTEMPTS", 5
+    )
+
+    done, failed = [], []
+    for job in jobs:
+        job.attempts += 1
+        if not job.faq.get_missing_translations(lang):
+            job.status = TranslationJob.DONE
+            job.last_error = ""
+            done.append(job)
+        else:
+            if job.attempts >= max_attempts:
+                job.status = TranslationJob.FAILED
+            else:
+                job.status = TranslationJob.PENDING
+            job.last_error = f"Translation to {lang} did not complete"
+            logger.warning(f"Translation job {job.pk} failed: {job.last_error}")
+            failed.append(job)
+
+    # Only finish jobs that were not re-queued while they were running
+    for job in done + failed:
+        TranslationJob.objects.filter(pk=job.pk, locked_by=job.locked_by).update(
+            status=job.status, attempts=job.attempts, last_error=job.last_error
+        )
+    if done:
+        invalidate_faq_cache(faq_ids=[job.faq_id for job in done])
+    return len(done), len(failed)
+
+
+def _process_language_in_thread(task):
+    try:
+        return _process_language(*task)
+    finally:
+        close_old_connections()
+
+
+def run_translation_jobs(jobs, concurrency=4):
+    """
+    Run claimed translation jobs with bounded concurrency.
+
+    Jobs are grouped by language so each group is translated with batched
+    backend calls, and at most ``concurrency`` groups run at the same time.
+
+    Returns:
+        tuple: Number of completed and failed jobs
+    """
+    batch_size = getattr(settings, "FAQ_SETTINGS", {}).get("TRANSLATION_BATCH_SIZE", 50)
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job.lang, []).append(job)
+
+    tasks = [
+        (lang, lang_jobs[start : start + batch_size])
+        for lang, lang_jobs in groups.items()
+        for start in range(0, len(lang_jobs), batch_size)
+    ]
+
+    if concurrency <= 1:
+        results = [_process_language(*task) for task in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(_process_language_in_thread, tasks))
+
+    done = sum(group_done for group_done, _ in results)
+    failed = sum(group_failed for _, group_failed in results)
+    return done, failed
@@ -0,0 +1,99 @@
+from datetime import timedelta
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from django_redis.compressors.identity import IdentityCompressor
+from django_redis.exceptions import CompressorError
+from django_redis.serializers.pickle import PickleSerializer
+from faqs.compressors import ZlibCompressor
+from faqs.models import FAQ
+
+CODECS = [
+    ("pickle", IdentityCompressor),
+    ("pickle+zlib", ZlibCompressor),
+]
+
+
+class Command(BaseCommand):
+    """Compare cache encodings of the translated FAQ list."""
+
+    help = (
+        "Report bytes per entry and encode/decode time of the faq:list_data "
+        "cache entry with and without compression."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--synthetic",
+            type=int,
+            default=0,
+            help="Benchmark this many generated FAQs instead of the database.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Timed runs per encoding."
+        )
+        parser.add_argument(
+            "--min-length",
+            type=int,
+            default=1024,
+            help="COMPRESS_MIN_LENGTH for the zlib compressor.",
+        )
+
+    def handle(self, *args, **options):
+        value = {
+            "value": self._records(options["synthetic"]),
+            "fresh_until": time.time(),
+            "delta": 0.5,
+        }
+        self.stdout.write(f"{len(value['value'])} FAQs per entry")
+        codec_options = {"COMPRESS_MIN_LENGTH": options["min_length"]}
+        serializer = PickleSerializer(codec_options)
+        for name, compressor_cls in CODECS:
+            compressor = compressor_cls(codec_options)
+            encode, payload = self._time(
+                lambda: compressor.compress(serializer.dumps(value)), options["repeat"]
+            )
+            decode, _ = self._time(
+                lambda: serializer.loads(self._decompress(compressor, payload)),
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{name:<14} {len(payload):>10} bytes  "
+                f"encode {encode * 1000:8.2f} ms  decode {decode * 1000:8.2f} ms"
+            )
+
+    def _records(self, synthetic):
+        if not synthetic:
+            return [
+                {"id": faq.id, **faq.get_translated_content("en")}
+                for faq in FAQ.objects.all()
+            ]
+        now = timezone.now()
+        return [
+            {
+                "id": index,
+                "question": f"<p>How do I change setting number {index}?</p>",
+                "answer": (
+                    f"<p>Open <strong>Settings</strong> and pick option {index}. "
+                    "Contact support if the option is missing.</p>" * 5
+                ),
+                "created_at": now - timedelta(days=index),
+                "updated_at": now,
+            }
+            for index in range(synthetic)
+        ]
+
+    def _time(self, func, repeat):
+        """Return the mean duration of ``func`` in seconds and its last result."""
+        started = time.perf_counter()
+        for _ in range(repeat):
+            result = func()
+        return (time.perf_counter() - started) / repeat, result
+
+    def _decompress(self, compressor, payload):
+        try:
+            return compressor.decompress(payload)
+        except CompressorError:
+            # Small values are stored uncompressed
+            return payload
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from faqs.models import FAQ, TranslationMemory
+from faqs.segmentation import translatable_segments
+
+
+class Command(BaseCommand):
+    """Report translation memory usage."""
+
+    help = "Show translation memory hit rate, size and characters saved."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--corpus",
+            action="store_true",
+            help="Also report how much text repeats across FAQ sentences.",
+        )
+
+    def handle(self, *args, **options):
+        stats = TranslationMemory.objects.stats()
+        self.stdout.write(f"Entries:  {stats['entries']}")
+        self.stdout.write(f"Hits:     {stats['hits']}")
+        self.stdout.write(f"Misses:   {stats['misses']}")
+        self.stdout.write(f"Hit rate: {stats['hit_rate']:.1%}")
+        self.stdout.write(
+            f"Characters saved: {stats['saved_chars']} of "
+            f"{stats['saved_chars'] + stats['sent_chars']} "
+            f"({stats['saved_chars_rate']:.1%})"
+        )
+        if options["corpus"]:
+            self._corpus_report()
+
+    def _corpus_report(self):
+        total = 0
+        sentences = set()
+        for fields in FAQ.objects.values_list("question", "answer").iterator():
+            for document in fields:
+                for sentence in translatable_segments(document, sentences=True):
+                    total += len(sentence)
+                    sentences.add(sentence)
+        unique = sum(len(sentence) for sentence in sentences)
+        self.stdout.write(
+            f"Corpus: {unique} unique of {total} characters "
+            f"({(total - unique) / total if total else 0:.1%} repeated)"
+        )
@@ -0,0 +1,57 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from faqs.jobs import run_translation_jobs
+from faqs.models import TranslationJob
+
+
+class Command(BaseCommand):
+    """Process queued FAQ translation jobs."""
+
+    help = "Run queued FAQ translation jobs with bounded concurrency."
+
+    def add_arguments(self, parser):
+        faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=faq_settings.get("TRANSLATION_WORKER_CONCURRENCY", 4),
+            help="Maximum number of translation batches running at once.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=faq_settings.get("TRANSLATION_WORKER_BATCH_SIZE", 200),
+            help="Number of jobs claimed per poll.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty.",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=int,
+            default=faq_settings.get("TRANSLATION_JOB_STALE_TIMEOUT", 10 * 60),
+            help="Seconds after which running jobs of a crashed worker are retried.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            TranslationJob.objects.requeue_stale(options["stale_timeout"])
+            jobs = TranslationJob.objects.claim(options["batch_size"])
+            if not jobs:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            done, failed = run_translation_jobs(jobs, options["concurrency"])
+            self.stdout.write(f"Translated {done} jobs, {failed} failed")
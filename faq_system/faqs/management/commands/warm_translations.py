@@ -0,0 +1,200 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils.dateparse import parse_datetime
+from faqs.models import FAQ, FAQTranslation
+
+
+class Command(BaseCommand):
+    """Pre-translate and pre-cache FAQs."""
+
+    help = (
+        "Translate and cache FAQs for every configured language, or a subset "
+        "selected by id range or updated_at window."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--languages",
+            nargs="+",
+            help="Language codes to warm (default: FAQ_SETTINGS['LANGUAGES']).",
+        )
+        parser.add_argument("--min-id", type=int, help="Lowest FAQ id to warm.")
+        parser.add_argument("--max-id", type=int, help="Highest FAQ id to warm.")
+        parser.add_argument(
+            "--updated-since", help="Only FAQs updated at or after this ISO datetime."
+        )
+        parser.add_argument(
+            "--updated-before", help="Only FAQs updated before this ISO datetime."
+        )
+        parser.add_argument(
+            "--workers", type=int, default=4, help="Number of parallel workers."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=100, help="FAQs translated per batch."
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=0,
+            help="Maximum FAQs started per second (0 for no limit).",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip FAQs completed by a previous interrupted run.",
+        )
+
+    def handle(self, *args, **options):
+        languages = options["languages"] or getattr(settings, "FAQ_SETTINGS", {}).get(
+            "LANGUAGES", ["en", "hi", "bn"]
+        )
+        languages = [lang for lang in languages if lang != "en"]
+        if not languages:
+            raise CommandError("No languages to warm.")
+
+        queryset = self._get_queryset(options)
+        checkpoint_key = self._checkpoint_key(languages, options)
+        if options["resume"]:
+            checkpoint = cache.get(checkpoint_key)
+            if checkpoint is not None:
+                self.stdout.write(f"Resuming after FAQ {checkpoint}")
+                queryset = queryset.filter(pk__gt=checkpoint)
+        else:
+            cache.delete(checkpoint_key)
+
+        ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+        batches = [
+            ids[start : start + batch_size] for start in range(0, len(ids), batch_size)
+        ]
+        self.stdout.write(
+            f"Warming {len(ids)} FAQs for {', '.join(languages)} "
+            f"in {len(batches)} batches"
+        )
+
+        done = translated = missing = failed = 0
+        started = time.monotonic()
+        for batch, (count, batch_missing) in self._run(batches, languages, options):
+            done += len(batch)
+            translated += count
+            missing += batch_missing
+            if batch_missing:
+                failed += 1
+            elif not failed:
+                # Batches complete in order, so everything up to here is done
+                cache.set(checkpoint_key, batch[-1], timeout=None)
+            elapsed = time.monotonic() - started
+            self.stdout.write(
+                f"[{done}/{len(ids)}] {translated} fields translated, "
+                f"{missing} missing ({done / elapsed if elapsed else 0:.1f} FAQs/s)"
+            )
+
+        if failed:
+            raise CommandError(
+                f"{missing} fields in {failed} batches could not be translated; "
+                "run again with --resume to retry them."
+            )
+        cache.delete(checkpoint_key)
+        self.stdout.write(self.style.SUCCESS(f"Warmed {done} FAQs"))
+
+    def _get_queryset(self, options):
+        queryset = FAQ.objects.all()
+        if options["min_id"] is not None:
+            queryset = queryset.filter(pk__gte=options["min_id"])
+        if options["max_id"] is not None:
+            queryset = queryset.filter(pk__lte=options["max_id"])
+        for option, lookup in (
+            ("updated_since", "updated_at__gte"),
+            ("updated_before", "updated_at__lt"),
+        ):
+            if options[option]:
+                value = parse_datetime(options[option])
+                if value is None:
+                    raise CommandError(f"Invalid datetime for --{option}.")
+                queryset = queryset.filter(**{lookup: value})
+        return queryset
+
+    def _checkpoint_key(self, languages, options):
+        signature = repr(
+            (
+                sorted(languages),
+                options["min_id"],
+                options["max_id"],
+                options["updated_since"],
+                options["updated_before"],
+                options["batch_size"],
+            )
+        )
+        digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:16]
+        return f"warm_translations:checkpoint:{digest}"
+
+    def _run(self, batches, languages, options):
+        """Yield ``(batch, (translated, missing))`` in order as batches complete."""
+        interval = 1 / options["rate"] if options["rate"] else 0
+        next_start = time.monotonic()
+
+        def throttle(batch):
+            nonlocal next_start
+            delay = next_start - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_start = max(next_start, time.monotonic()) + interval * len(batch)
+
+        if options["workers"] <= 1:
+            for batch in batches:
+                throttle(batch)
+                yield batch, warm_batch(batch, languages)
+            return
+
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            for batch in batches:
+                throttle(batch)
+                in_flight.append(
+                    (batch, executor.submit(warm_batch_in_thread, batch, languages))
+                )
+                while len(in_flight) > options["workers"] or in_flight[0][1].done():
+                    batch_done, future = in_flight.popleft()
+                    yield batch_done, future.result()
+                    if not in_flight:
+                        break
+            while in_flight:
+                batch_done, future = in_flight.popleft()
+                yield batch_done, future.result()
+
+
+def warm_batch(ids, languages):
+    """
+    Translate and cache a batch of FAQs.
+
+    Content is only cached once all of its fields are translated, so the
+    English fallback is never cached in place of a failed translation.
+
+    Returns:
+        tuple: Number of fields translated and of fields still missing
+    """
+    faqs = list(FAQ.objects.filter(pk__in=ids).with_translations(languages))
+    count = FAQTranslation.objects.translate_missing(faqs, languages)
+    missing = 0
+    for faq in faqs:
+        for lang in languages:
+            fields = faq.get_missing_translations(lang)
+            if fields:
+                missing += len(fields)
+            else:
+                faq.get_translated_content(lang)
+    return count, missing
+
+
+def warm_batch_in_thread(ids, languages):
+    try:
+        return warm_batch(ids, languages)
+    finally:
+        close_old_connections()
@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+from .caching import lang_namespace, set_tagged, versioned_key
+from .responses import is_uncacheable
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    Full-page cache for anonymous GET requests to ``faq_list``.
+
+    Requests without a session or messages cookie and with at most a known
+    ``lang`` parameter are answered from the cache before the session
+    middleware, context processors or the view run. Pages are keyed by
+    language and the FAQ list version, so every write path that calls
+    ``invalidate_faq_cache`` also invalidates them. ``PAGE_CACHE_TIMEOUT``
+    sets how long pages are kept; ``None`` disables the cache.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        key = self._cache_key(request)
+        if key is None:
+            return self.get_response(request)
+
+        page = cache.get(key)
+        if page is not None:
+            return self._cached_response(request, page)
+
+        response = self.get_response(request)
+        if self._is_cacheable(request, response):
+            page = {
+                "content": response.content,
+                "headers": dict(response.headers),
+            }
+            set_tagged(key, page, self._timeout(), ["list"])
+        return response
+
+    def _timeout(self):
+        return getattr(settings, "FAQ_SETTINGS", {}).get("PAGE_CACHE_TIMEOUT", 60 * 10)
+
+    def _cache_key(self, request):
+        if self._timeout() is None or request.method not in ("GET", "HEAD"):
+            return None
+        if request.path != reverse("faq_list"):
+            return None
+        if (
+            settings.SESSION_COOKIE_NAME in request.COOKIES
+            or "messages" in request.COOKIES
+        ):
+            return None
+        languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+            "LANGUAGES", ["en", "hi", "bn"]
+        )
+        lang = request.GET.get("lang", "en")
+        if set(request.GET) - {"lang"} or lang not in languages:
+            return None
+        return versioned_key(f"faq:page:{lang}", "list", lang_namespace(lang))
+
+    def _is_cacheable(self, request, response):
+        user = getattr(request, "user", None)
+        return (
+            request.method == "GET"
+            and response.status_code == 200
+            and not response.streaming
+            and not response.cookies
+            and not is_uncacheable(response)
+            and not (user is not None and user.is_authenticated)
+        )
+
+    def _cached_response(self, request, page):
+        headers = page["headers"]
+        last_modified = headers.get("Last-Modified")
+        not_modified = get_conditional_response(
+            request,
+            etag=headers.get("ETag"),
+            last_modified=last_modified and parse_http_date_safe(last_modified),
+        )
+        if not_modified is not None:
+            skipped = {"content-length", "content-type"}
+            response = not_modified
+        else:
+            skipped = set()
+            response = HttpResponse(page["content"])
+        for header, value in headers.items():
+            if header.lower() not in skipped:
+                response.headers[header] = value
+        return response
@@ -0,0 +1,56 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("faqs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FAQTranslation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("lang", models.CharField(max_length=10, verbose_name="Language")),
+                (
+                    "field",
+                    models.CharField(
+                        choices=[("question", "Question"), ("answer", "Answer")],
+                        max_length=20,
+                        verbose_name="Field",
+                    ),
+                ),
+                ("text", models.TextField(verbose_name="Text")),
+                ("source_hash", models.CharField(max_length=64)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "faq",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translations",
+                        to="faqs.faq",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "FAQ translation",
+                "verbose_name_plural": "FAQ translations",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("faq", "lang", "field"), name="unique_faq_translation"
+                    )
+                ],
+            },
+        ),
+    ]
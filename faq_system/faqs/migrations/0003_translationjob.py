@@ -0,0 +1,69 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("faqs", "0002_faqtranslation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("lang", models.CharField(max_length=10, verbose_name="Language")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("locked_by", models.UUIDField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "faq",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="translation_jobs",
+                        to="faqs.faq",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Translation job",
+                "verbose_name_plural": "Translation jobs",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "updated_at"],
+                        name="faqs_transl_status_3c795b_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("faq", "lang"), name="unique_translation_job"
+                    )
+                ],
+            },
+        ),
+    ]
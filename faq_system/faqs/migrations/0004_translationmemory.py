@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("faqs", "0003_translationjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("lang", models.CharField(max_length=10, verbose_name="Language")),
+                ("backend", models.CharField(max_length=50, verbose_name="Backend")),
+                ("text", models.TextField(verbose_name="Text")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Translation memory entry",
+                "verbose_name_plural": "Translation memory entries",
+            },
+        ),
+    ]
@@ -1,15 +1,62 @@
+from datetime import timedelta
+from functools import partial
+import hashlib
 import logging
+import time
+import uuid
 
+from django.conf import settings
 from django.core.cache import cache
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_ckeditor_5.fields import CKEditor5Field
-from googletrans import Translator
 
-from faq_system import settings
+from .caching import (
+    faq_namespace,
+    get_or_set_stale,
+    invalidate_faq_cache,
+    lang_namespace,
+    set_with_stale,
+    single_flight,
+    versioned_key,
+)
+from .segmentation import join_segments, translatable_segments
+from .translation import (
+    get_translation_backend,
+    normalize_text,
+    raise_first_error,
+    translate_concurrently,
+    translation_digest,
+    TranslationCircuitOpen,
+    TranslationError,
+    TranslationRateLimited,
+)
 
 logger = logging.getLogger(__name__)
 
+TRANSLATABLE_FIELDS = ("question", "answer")
+
+
+def source_hash(text):
+    """Return a stable digest of the source text a translation was made from."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class FAQQuerySet(models.QuerySet):
+    """QuerySet with helpers for loading stored translations."""
+
+    def with_translations(self, languages):
+        """Prefetch stored translations for the given language codes."""
+        if isinstance(languages, str):
+            languages = [languages]
+        return self.prefetch_related(
+            models.Prefetch(
+                "translations",
+                queryset=FAQTranslation.objects.filter(lang__in=languages),
+            )
+        )
+
 
 class FAQ(models.Model):
     """
@@ -24,58 +71,69 @@ class FAQ(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    def _get_cache_key(self, field, lang):
-        """Generate cache key for field translation."""
-        return f"faq:translation:{self.id}:{field}:{lang}"
+    objects = FAQQuerySet.as_manager()
 
-    def _clear_translations_cache(self):
-        """Clear all cached translations for this FAQ."""
-        from django.conf import settings
+    def _get_cache_tags(self, lang):
+        """Return the namespaces that invalidate this FAQ's cached data."""
+        return [faq_namespace(self.id), lang_namespace(lang)]
 
-        languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-            "LANGUAGES", ["en", "hi", "bn"]
+    def _get_cache_key(self, field, lang):
+        """Generate cache key for field translation."""
+        return versioned_key(
+            f"faq:{field}:{self.id}:{lang}", *self._get_cache_tags(lang)
         )
-        # Generate cache keys for both question and answer in all languages
-        cache_keys = [self._get_cache_key("question", lang) for lang in languages] + [
-            self._get_cache_key("answer", lang) for lang in languages
-        ]
-        cache.delete_many(cache_keys)
 
-    def _translate_text(self, text, lang):
-        """
-        Translate text to specified language with caching support.
+    def _clear_translations_cache(self, faq_id=None):
+        """Invalidate every cached entry for this FAQ and the FAQ lists."""
+        faq_id = self.id if faq_id is None else faq_id
+        invalidate_faq_cache(faq_ids=[faq_id] if faq_id is not None else [])
+        self._translated_content = {}
 
-        Returns original text if translation fails or language is English.
+    def _get_stored_translations(self, lang):
         """
-        if lang == "en":
-            return text
+        Return stored translations for a language that match the current source.
 
-        cache_key = f"faq:translation:{hash(text)}:{lang}"
-        cached_translation = cache.get(cache_key)
+        Uses prefetched translations when available, see
+        ``FAQQuerySet.with_translations``.
+        """
+        stored = {}
+        for translation in self.translations.all():
+            if translation.lang != lang:
+                continue
+            if translation.source_hash == source_hash(getattr(self, translation.field)):
+                stored[translation.field] = translation.text
+        return stored
 
-        if cached_translation is not None:
-            return cached_translation
+    def _translate_and_store(self, fields, lang):
+        """
+        Translate fields in one batch and persist them as ``FAQTranslation`` rows.
 
-        try:
-            translator = Translator()
-            translation = translator.translate(text, dest=lang)
-            translated_text = translation.text
+        Returns:
+            dict: Translated text per field; fields that failed are omitted
+        """
+        items = [(self, field, lang) for field in fields]
+        return {
+            translation.field: translation.text
+            for translation in FAQTranslation.objects.translate_batch(items)
+        }
 
-            # Cache translation with configurable timeout
-            timeout = getattr(settings, "FAQ_SETTINGS", {}).get(
-                "TRANSLATION_CACHE_TIMEOUT", 60 * 60 * 24
-            )
-            cache.set(cache_key, translated_text, timeout=timeout)
+    def get_missing_translations(self, lang):
+        """Return the fields with no up-to-date stored translation for a language."""
+        if lang == "en":
+            return []
+        stored = self._get_stored_translations(lang)
+        return [field for field in TRANSLATABLE_FIELDS if field not in stored]
 
-            return translated_text
-        except Exception as e:
-            logger.error(f"Translation failed for language {lang}: {str(e)}")
-            return text
+    def _has_prefetched_translations(self):
+        return "translations" in getattr(self, "_prefetched_objects_cache", {})
 
     def get_translated_content(self, lang="en"):
         """
         Get FAQ content in specified language.
 
+        Stored ``FAQTranslation`` rows are the system of record; the cache is
+        only consulted when translations were not prefetched.
+
         Args:
             lang (str): Target language code (default: 'en')
 
@@ -90,33 +148,55 @@ class FAQ(models.Model):
                 "updated_at": self.updated_at,
             }
 
-        cache_key = f"faq:content:{self.id}:{lang}"
-        cached_content = cache.get(cache_key)
+        memo = self.__dict__.setdefault("_translated_content", {})
+        if lang in memo:
+            return memo[lang]
 
-        if cached_content is not None:
-            return cached_content
+        cache_key = self._get_cache_key("content", lang)
+        timeout = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_TIMEOUT", 60 * 60)
+        if self._has_prefetched_translations():
+            translated_content = self._build_translated_content(lang)
+            set_with_stale(
+                cache_key, translated_content, timeout, [faq_namespace(self.id)]
+            )
+        else:
+            translated_content = get_or_set_stale(
+                cache_key,
+                partial(self._build_translated_content, lang),
+                timeout,
+                fallback=partial(self.get_translated_content, "en"),
+                tags=[faq_namespace(self.id)],
+            )
+        memo[lang] = translated_content
+        return translated_content
 
-        # Translate and cache content
-        translated_content = {
-            "question": self._translate_text(self.question, lang),
-            "answer": self._translate_text(self.answer, lang),
+    def _build_translated_content(self, lang):
+        """Read stored translations, translating only missing or outdated fields."""
+        stored = self._get_stored_translations(lang)
+        missing = [field for field in TRANSLATABLE_FIELDS if field not in stored]
+        if missing:
+            stored.update(self._translate_and_store(missing, lang))
+        return {
+            "question": stored.get("question", self.question),
+            "answer": stored.get("answer", self.answer),
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
-        timeout = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_TIMEOUT", 60 * 60)
-        cache.set(cache_key, translated_content, timeout=timeout)
-        return translated_content
-
     def save(self, *args, **kwargs):
-        """Override save to clear translation cache."""
-        self._clear_translations_cache()
+        """Override save to clear translation cache and queue translations."""
         super().save(*args, **kwargs)
+        self._clear_translations_cache()
+        transaction.on_commit(partial(TranslationJob.objects.enqueue, [self]))
 
     def delete(self, *args, **kwargs):
         """Override delete to clear translation cache."""
-        self._clear_translations_cache()
-        super().delete(*args, **kwargs)
+        # Invalidate once the row is gone, as outside a transaction this runs
+        # right away and readers could otherwise re-cache the deleted FAQ
+        faq_id = self.id
+        result = super().delete(*args, **kwargs)
+        self._clear_translations_cache(faq_id)
+        return result
 
     def __str__(self):
         return self.question[:50]
@@ -129,3 +209,631 @@ class FAQ(models.Model):
             models.Index(fields=["created_at"]),
             models.Index(fields=["question"]),
         ]
+
+
+class FAQTranslationManager(models.Manager):
+    """Manager providing batch translation of FAQ fields."""
+
+    def translate_batch(self, items, batch_size=None):
+        """
+        Translate many FAQ fields with as few backend calls as possible.
+
+        Items are grouped by language, identical source texts are translated
+        once, and the results are written back with a single bulk upsert.
+
+        Args:
+            items: Iterable of ``(faq, field, lang)`` tuples
+            batch_size (int): Maximum number of texts per backend call
+
+        Returns:
+            list: The stored ``FAQTranslation`` objects
+        """
+        if batch_size is None:
+            batch_size = getattr(settings, "FAQ_SETTINGS", {}).get(
+                "TRANSLATION_BATCH_SIZE", get_translation_backend().max_batch_size
+            )
+
+        texts_by_lang = {}
+        for faq, field, lang in items:
+            if lang == "en":
+                continue
+            texts_by_lang.setdefault(lang, {})[getattr(faq, field)] = None
+
+        results = TranslationMemory.objects.translate_documents_languages(
+            {lang: list(texts) for lang, texts in texts_by_lang.items()}, batch_size
+        )
+        translated = {}
+        for lang, result in results.items():
+            errors = []
+            for text, text_result in zip(texts_by_lang[lang], result):
+                if isinstance(text_result, Exception):
+                    errors.append(text_result)
+                else:
+                    translated[(text, lang)] = text_result
+            if errors:
+                logger.error(
+                    f"Batch translation failed for {len(errors)} texts in language "
+                    f"{lang}: {errors[0]}"
+                )
+
+        translations = {}
+        for faq, field, lang in items:
+            text = getattr(faq, field)
+            if (text, lang) not in translated:
+                continue
+            translations[(faq.pk, lang, field)] = FAQTranslation(
+                faq=faq,
+                lang=lang,
+                field=field,
+                text=translated[(text, lang)],
+                source_hash=source_hash(text),
+            )
+
+        return self.bulk_create(
+            translations.values(),
+            update_conflicts=True,
+            unique_fields=["faq", "lang", "field"],
+            update_fields=["text", "source_hash", "updated_at"],
+        )
+
+    def translate_missing(self, faqs, languages):
+        """
+        Batch translate every missing or outdated field of the given FAQs.
+
+        The FAQs' prefetched translations are refreshed afterwards so that
+        ``FAQ.get_translated_content`` reads the new rows without translating.
+
+        Returns:
+            int: Number of translations stored
+        """
+        faqs = list(faqs)
+        items = [
+            (faq, field, lang)
+            for faq in faqs
+            for lang in languages
+            for field in faq.get_missing_translations(lang)
+        ]
+        if not items:
+            return 0
+
+        stored = self.translate_batch(items)
+        for faq in faqs:
+            getattr(faq, "_prefetched_objects_cache", {}).pop("translations", None)
+            faq.__dict__.pop("_translated_content", None)
+        models.prefetch_related_objects(
+            faqs,
+            models.Prefetch("translations", queryset=self.filter(lang__in=languages)),
+        )
+        return len(stored)
+
+
+class FAQTranslation(models.Model):
+    """
+    Durable translation of a single FAQ field into one language.
+
+    ``source_hash`` records the source text the translation was made from, so
+    edits to the FAQ make outdated rows easy to detect.
+    """
+
+    FIELD_CHOICES = [
+        ("question", _("Question")),
+        ("answer", _("Answer")),
+    ]
+
+    faq = models.ForeignKey(FAQ, on_delete=models.CASCADE, related_name="translations")
+    lang = models.CharField(_("Language"), max_length=10)
+    field = models.CharField(_("Field"), max_length=20, choices=FIELD_CHOICES)
+    text = models.TextField(_("Text"))
+    source_hash = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = FAQTranslationManager()
+
+    def __str__(self):
+        return f"{self.faq_id}:{self.field}:{self.lang}"
+
+    class Meta:
+        verbose_name = _("FAQ translation")
+        verbose_name_plural = _("FAQ translations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["faq", "lang", "field"], name="unique_faq_translation"
+            ),
+        ]
+
+
+class TranslationMemoryManager(models.Manager):
+    """Manager serving translations from the content-addressed memory."""
+
+    HITS_KEY = "translation_memory:hits"
+    MISSES_KEY = "translation_memory:misses"
+    SAVED_CHARS_KEY = "translation_memory:saved_chars"
+    SENT_CHARS_KEY = "translation_memory:sent_chars"
+
+    def _cache_key(self, digest):
+        return f"translation_memory:{digest}"
+
+    def _count(self, key, delta):
+        if delta:
+            cache.add(key, 0, timeout=None)
+            cache.incr(key, delta)
+
+    def translate(self, texts, lang):
+        """
+        Translate texts, reusing any translation already in the memory.
+
+        Raises:
+            TranslationError: If the backend fails for the remaining texts
+        """
+        return raise_first_error(self.translate_languages({lang: texts})[lang])
+
+    def _lookup(self, texts, lang, backend):
+        """Return digests, memory hits and pending texts keyed by digest."""
+        digests = [translation_digest(text, lang, backend.name) for text in texts]
+        found = {}
+
+        cached = cache.get_many([self._cache_key(digest) for digest in set(digests)])
+        for digest in set(digests):
+            if self._cache_key(digest) in cached:
+                found[digest] = cached[self._cache_key(digest)]
+
+        missing = set(digests) - found.keys()
+        if missing:
+            stored = dict(self.filter(digest__in=missing).values_list("digest", "text"))
+            found.update(stored)
+            self._warm_cache(stored)
+
+        pending = {}
+        for text, digest in zip(texts, digests):
+            if digest not in found:
+                pending.setdefault(digest, normalize_text(text))
+        self._count(self.HITS_KEY, len(texts) - len(pending))
+        self._count(self.MISSES_KEY, len(pending))
+        sent_chars = sum(len(text) for text in pending.values())
+        total_chars = sum(len(normalize_text(text)) for text in texts)
+        self._count(self.SAVED_CHARS_KEY, total_chars - sent_chars)
+        self._count(self.SENT_CHARS_KEY, sent_chars)
+        return digests, found, pending
+
+    def translate_languages(self, texts_by_lang, batch_size=None):
+        """
+        Translate texts into several languages at once.
+
+        Lookups go through the cache first, then the database; only texts
+        seen by neither are sent to the backend, once per distinct digest.
+        The backend calls for all languages run concurrently.
+
+        Args:
+            texts_by_lang (dict): Maps language codes to lists of texts
+            batch_size (int): Maximum number of texts per backend call
+
+        Texts that failed recently are skipped until their backoff has
+        passed; the remaining texts are still sent.
+
+        Returns:
+            dict: Maps each language to its translated texts, with the
+            ``TranslationError`` that prevented a translation in its place
+        """
+        backend = get_translation_backend()
+        lookups = {
+            lang: self._lookup(list(texts), lang, backend)
+            for lang, texts in texts_by_lang.items()
+        }
+        failed = {}
+        requests = []
+        for lang, (digests, found, pending) in lookups.items():
+            error = self._backoff_error(lang)
+            for digest in self._in_backoff(pending):
+                failed[digest] = error
+                del pending[digest]
+            if pending:
+                requests.append((lang, pending))
+
+        if requests:
+            results = self._translate_pending(requests, batch_size, backend)
+            for (lang, pending), result in zip(requests, results):
+                if isinstance(result, Exception):
+                    failed.update(dict.fromkeys(pending, result))
+                    continue
+                for digest, translation in result.items():
+                    if isinstance(translation, Exception):
+                        failed[digest] = translation
+                    else:
+                        lookups[lang][1][digest] = translation
+
+        return {
+            lang: [
+                found[digest] if digest in found else failed[digest]
+                for digest in digests
+            ]
+            for lang, (digests, found, pending) in lookups.items()
+        }
+
+    def _translate_pending(self, requests, batch_size, backend):
+        """
+        Translate texts missing from the memory at most once across processes.
+
+        Concurrent callers missing the same texts wait for the first one to
+        store its translations instead of sending them to the backend again,
+        and get a ``TranslationError`` if that takes longer than
+        ``SINGLE_FLIGHT_WAIT`` seconds.
+
+        Args:
+            requests (list): ``(lang, pending)`` pairs, with pending texts
+                keyed by digest
+
+        Returns:
+            list: Per request, translations keyed by digest, with the
+            ``TranslationError`` that prevented a translation in its place,
+            or a ``TranslationError`` for the whole request
+        """
+        return single_flight(
+            self._flight_key(digest for _, pending in requests for digest in pending),
+            partial(self._send_pending, requests, batch_size, backend),
+            partial(self._load_pending, requests),
+            lambda results: None,
+            fallback=lambda: [
+                TranslationError(f"Translation to {lang} is still in progress")
+                for lang, _ in requests
+            ],
+        )
+
+    def _flight_key(self, digests):
+        payload = "\x00".join(sorted(digests)).encode("utf-8")
+        return f"translation_memory:flight:{hashlib.sha256(payload).hexdigest()}"
+
+    def _load_pending(self, requests):
+        """Return the stored translations of every request, or ``None``."""
+        keys = [
+            self._cache_key(digest) for _, pending in requests for digest in pending
+        ]
+        cached = cache.get_many(keys)
+        if len(cached) < len(keys):
+            return None
+        return [
+            {digest: cached[self._cache_key(digest)] for digest in pending}
+            for _, pending in requests
+        ]
+
+    def _send_pending(self, requests, batch_size, backend):
+        """
+        Send the texts not translated by a previous lock holder to the backend.
+
+        Texts the previous holder failed on are backing off by now and are not
+        sent again, so waiters taking over the lock do not retry them one
+        after another.
+        """
+        cached = cache.get_many(
+            [self._cache_key(digest) for _, pending in requests for digest in pending]
+        )
+        backing_off = self._in_backoff(
+            [
+                digest
+                for _, pending in requests
+                for digest in pending
+                if self._cache_key(digest) not in cached
+            ]
+        )
+        output = []
+        remaining = []
+        for lang, pending in requests:
+            lang_translated = {
+                digest: cached[self._cache_key(digest)]
+                for digest in pending
+                if self._cache_key(digest) in cached
+            }
+            error = self._backoff_error(lang)
+            lang_translated.update(
+                (digest, error) for digest in pending if digest in backing_off
+            )
+            output.append(lang_translated)
+            untranslated = {
+                digest: text
+                for digest, text in pending.items()
+                if digest not in lang_translated
+            }
+            if untranslated:
+                remaining.append((len(output) - 1, lang, untranslated))
+
+        results = translate_concurrently(
+            [(pending.values(), lang) for _, lang, pending in remaining], batch_size
+        )
+
+        translated = {}
+        entries = []
+        failures = []
+        for (index, lang, pending), result in zip(remaining, results):
+            output[index].update(zip(pending, result))
+            for digest, text in zip(pending, result):
+                if not isinstance(text, Exception):
+                    translated[digest] = text
+                    entries.append(
+                        TranslationMemory(
+                            digest=digest, lang=lang, backend=backend.name, text=text
+                        )
+                    )
+                # Rejected calls never reached the backend, so do not back off
+                elif not isinstance(
+                    text, (TranslationCircuitOpen, TranslationRateLimited)
+                ):
+                    failures.append(digest)
+        if failures:
+            self._record_failures(failures)
+        if entries:
+            self.bulk_create(entries, ignore_conflicts=True)
+            self._warm_cache(translated)
+        return output
+
+    def translate_documents(self, documents, lang):
+        """
+        Translate HTML documents segment by segment.
+
+        Raises:
+            TranslationError: If the backend fails
+        """
+        return raise_first_error(
+            self.translate_documents_languages({lang: documents})[lang]
+        )
+
+    def translate_documents_languages(self, documents_by_lang, batch_size=None):
+        """
+        Translate HTML documents into several languages at once.
+
+        Only text nodes are translated and the markup is preserved. Each
+        segment is looked up in the memory on its own, so after an edit only
+        the segments whose text changed reach the backend. With
+        ``TRANSLATION_SENTENCE_MEMORY`` (the default) every sentence is a
+        segment, so boilerplate shared between FAQs is translated once for
+        the whole corpus. Otherwise only text nodes longer than
+        ``TRANSLATION_MAX_CHUNK_SIZE`` characters are split at sentence
+        boundaries so their chunks can be translated in parallel.
+
+        Returns:
+            dict: Maps each language to its translated documents, with the
+            ``TranslationError`` that prevented a document in its place
+        """
+        faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+        max_chunk_size = faq_settings.get("TRANSLATION_MAX_CHUNK_SIZE", 1000)
+        sentences = faq_settings.get("TRANSLATION_SENTENCE_MEMORY", True)
+        segments_by_lang = {}
+        for lang, documents in documents_by_lang.items():
+            segments = segments_by_lang.setdefault(lang, {})
+            for document in documents:
+                segments.update(
+                    dict.fromkeys(
+                        translatable_segments(document, max_chunk_size, sentences)
+                    )
+                )
+
+        results = self.translate_languages(
+            {lang: list(segments) for lang, segments in segments_by_lang.items()},
+            batch_size,
+        )
+
+        output = {}
+        for lang, documents in documents_by_lang.items():
+            translations = dict(zip(segments_by_lang[lang], results[lang]))
+            output[lang] = []
+            for document in documents:
+                errors = [
+                    translations[segment]
+                    for segment in translatable_segments(
+                        document, max_chunk_size, sentences
+                    )
+                    if isinstance(translations[segment], Exception)
+                ]
+                output[lang].append(
+                    errors[0]
+                    if errors
+                    else join_segments(
+                        document, translations, max_chunk_size, sentences
+                    )
+                )
+        return output
+
+    def _failure_key(self, digest):
+        return f"translation_memory:failure:{digest}"
+
+    def _backoff_error(self, lang):
+        return TranslationError(
+            f"Translation to {lang} is backing off after recent failures"
+        )
+
+    def _in_backoff(self, digests):
+        """Return the digests of texts that failed recently and are backing off."""
+        failures = cache.get_many([self._failure_key(digest) for digest in digests])
+        now = time.time()
+        return {
+            digest
+            for digest in digests
+            if failures.get(self._failure_key(digest), {}).get("retry_at", 0) > now
+        }
+
+    def _record_failures(self, digests):
+        """
+        Remember failed texts so they are not retried immediately.
+
+        The backoff doubles with each consecutive failure, starting at
+        ``TRANSLATION_FAILURE_BACKOFF`` seconds and capped at
+        ``TRANSLATION_FAILURE_MAX_BACKOFF``.
+        """
+        faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+        base = faq_settings.get("TRANSLATION_FAILURE_BACKOFF", 30)
+        maximum = faq_settings.get("TRANSLATION_FAILURE_MAX_BACKOFF", 60 * 60)
+        keys = [self._failure_key(digest) for digest in digests]
+        previous = cache.get_many(keys)
+        now = time.time()
+
+        failures = {}
+        for key in keys:
+            count = previous.get(key, {}).get("count", 0) + 1
+            backoff = min(base * 2 ** (count - 1), maximum)
+            failures[key] = {"count": count, "retry_at": now + backoff}
+        # Keep the failure count around past the backoff so it keeps growing
+        cache.set_many(failures, timeout=maximum * 2)
+
+    def _warm_cache(self, translations):
+        timeout = getattr(settings, "FAQ_SETTINGS", {}).get(
+            "TRANSLATION_CACHE_TIMEOUT", 60 * 60 * 24
+        )
+        cache.set_many(
+            {self._cache_key(digest): text for digest, text in translations.items()},
+            timeout=timeout,
+        )
+
+    def stats(self):
+        """Return lookup counters, hit rate and characters saved by the memory."""
+        counters = cache.get_many(
+            [
+                self.HITS_KEY,
+                self.MISSES_KEY,
+                self.SAVED_CHARS_KEY,
+                self.SENT_CHARS_KEY,
+            ]
+        )
+        hits = counters.get(self.HITS_KEY, 0)
+        misses = counters.get(self.MISSES_KEY, 0)
+        saved_chars = counters.get(self.SAVED_CHARS_KEY, 0)
+        sent_chars = counters.get(self.SENT_CHARS_KEY, 0)
+        total = hits + misses
+        total_chars = saved_chars + sent_chars
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+            "saved_chars": saved_chars,
+            "sent_chars": sent_chars,
+            "saved_chars_rate": saved_chars / total_chars if total_chars else 0.0,
+            "entries": self.count(),
+        }
+
+
+class TranslationMemory(models.Model):
+    """
+    Translation of a normalized source text, addressed by its digest.
+
+    The digest covers the normalized text, target language and backend, so
+    identical texts across FAQs are translated only once.
+    """
+
+    digest = models.CharField(max_length=64, unique=True)
+    lang = models.CharField(_("Language"), max_length=10)
+    backend = models.CharField(_("Backend"), max_length=50)
+    text = models.TextField(_("Text"))
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TranslationMemoryManager()
+
+    def __str__(self):
+        return f"{self.backend}:{self.lang}:{self.digest[:12]}"
+
+    class Meta:
+        verbose_name = _("Translation memory entry")
+        verbose_name_plural = _("Translation memory entries")
+
+
+class TranslationJobManager(models.Manager):
+    """Manager implementing a database-backed translation job queue."""
+
+    def enqueue(self, faqs, languages=None):
+        """
+        Queue translation of the given FAQs into every configured language.
+
+        An existing job for the same FAQ and language is reset to pending
+        rather than duplicated.
+        """
+        if languages is None:
+            languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+                "LANGUAGES", ["en", "hi", "bn"]
+            )
+        jobs = [
+            TranslationJob(faq=faq, lang=lang)
+            for faq in faqs
+            for lang in languages
+            if lang != "en"
+        ]
+        return self.bulk_create(
+            jobs,
+            update_conflicts=True,
+            unique_fields=["faq", "lang"],
+            update_fields=["status", "attempts", "locked_by", "updated_at"],
+        )
+
+    def claim(self, limit):
+        """
+        Atomically mark up to ``limit`` pending jobs as running.
+
+        Each claim is tagged with a unique token so concurrent workers never
+        process the same job.
+        """
+        token = uuid.uuid4()
+        pending = self.filter(status=TranslationJob.PENDING).order_by("updated_at")
+        ids = list(pending.values_list("pk", flat=True)[:limit])
+        self.filter(pk__in=ids, status=TranslationJob.PENDING).update(
+            status=TranslationJob.RUNNING, locked_by=token, updated_at=timezone.now()
+        )
+        claimed = list(self.filter(locked_by=token).select_related("faq"))
+        # Prefetch the stored translations the jobs need in one query
+        models.prefetch_related_objects(
+            claimed,
+            models.Prefetch(
+                "faq__translations",
+                queryset=FAQTranslation.objects.filter(
+                    lang__in={job.lang for job in claimed}
+                ),
+            ),
+        )
+        return claimed
+
+    def requeue_stale(self, timeout):
+        """Return running jobs older than ``timeout`` seconds to the queue."""
+        cutoff = timezone.now() - timedelta(seconds=timeout)
+        return self.filter(status=TranslationJob.RUNNING, updated_at__lt=cutoff).update(
+            status=TranslationJob.PENDING, locked_by=None
+        )
+
+
+class TranslationJob(models.Model):
+    """Pending translation of one FAQ into one language."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, _("Pending")),
+        (RUNNING, _("Running")),
+        (DONE, _("Done")),
+        (FAILED, _("Failed")),
+    ]
+
+    faq = models.ForeignKey(
+        FAQ, on_delete=models.CASCADE, related_name="translation_jobs"
+    )
+    lang = models.CharField(_("Language"), max_length=10)
+    status = models.CharField(
+        _("Status"), max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    locked_by = models.UUIDField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TranslationJobManager()
+
+    def __str__(self):
+        return f"{self.faq_id}:{self.lang}:{self.status}"
+
+    class Meta:
+        verbose_name = _("Translation job")
+        verbose_name_plural = _("Translation jobs")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["faq", "lang"], name="unique_translation_job"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "updated_at"]),
+        ]
@@ -0,0 +1,120 @@
+import abc
+import logging
+import urllib.request
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PURGE_BACKEND = {"BACKEND": "faqs.purge.NullPurgeBackend", "OPTIONS": {}}
+
+LIST_SURROGATE_KEY = "faqs"
+
+_backend = None
+
+# Surrogate keys purged through LocalPurgeBackend, for tests
+outbox = []
+
+
+def faq_surrogate_key(faq_id):
+    return f"faq-{faq_id}"
+
+
+def lang_surrogate_key(lang):
+    return f"lang-{lang}"
+
+
+class BasePurgeBackend(abc.ABC):
+    """Base class for backends purging a reverse proxy or CDN by surrogate key."""
+
+    @abc.abstractmethod
+    def purge(self, keys):
+        """
+        Purge every cached response tagged with any of the surrogate keys.
+
+        Args:
+            keys (list): Surrogate keys as sent in ``Surrogate-Key`` headers
+        """
+
+
+class NullPurgeBackend(BasePurgeBackend):
+    """Backend for deployments without a caching proxy."""
+
+    def purge(self, keys):
+        pass
+
+
+class LocalPurgeBackend(BasePurgeBackend):
+    """Records purged keys in ``faqs.purge.outbox`` instead of calling a proxy."""
+
+    def purge(self, keys):
+        outbox.extend(keys)
+
+
+class HTTPPurgeBackend(BasePurgeBackend):
+    """
+    Purge by sending the surrogate keys to an HTTP endpoint.
+
+    Sends one ``method`` request to ``url`` with the keys space-separated in
+    the ``header`` header, as Varnish (xkey) and Fastly-style purge APIs
+    expect. Extra ``headers``, such as an API token, are sent along.
+    """
+
+    def __init__(
+        self, url, method="PURGE", header="Surrogate-Key", headers=None, timeout=5
+    ):
+        self.url = url
+        self.method = method
+        self.header = header
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def purge(self, keys):
+        request = urllib.request.Request(
+            self.url,
+            method=self.method,
+            headers={**self.headers, self.header: " ".join(keys)},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+def get_purge_backend():
+    """
+    Return the configured purge backend instance.
+
+    Configured through ``FAQ_SETTINGS["PURGE_BACKEND"]``, a dict with a
+    dotted ``BACKEND`` path and backend ``OPTIONS``.
+    """
+    global _backend
+    if _backend is None:
+        config = getattr(settings, "FAQ_SETTINGS", {}).get(
+            "PURGE_BACKEND", DEFAULT_PURGE_BACKEND
+        )
+        backend_cls = import_string(config["BACKEND"])
+        options = {
+            key.lower(): value for key, value in config.get("OPTIONS", {}).items()
+        }
+        _backend = backend_cls(**options)
+    return _backend
+
+
+def purge_surrogate_keys(keys):
+    """Purge the proxy, logging failures so writes never fail because of it."""
+    if not keys:
+        return
+    try:
+        get_purge_backend().purge(list(keys))
+    except Exception as e:
+        logger.error(f"Purging surrogate keys {keys} failed: {str(e)}")
+
+
+@receiver(setting_changed)
+def reset_purge_backend(*, setting, **kwargs):
+    """Drop the cached backend when FAQ settings change (e.g. in tests)."""
+    global _backend
+    if setting == "FAQ_SETTINGS":
+        _backend = None
@@ -0,0 +1,103 @@
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Refills the bucket from the time elapsed since the last call, then takes the
+# requested tokens if enough are available, or with ``partial`` as many whole
+# tokens as are available. Returns the number of tokens taken. Redis' own clock
+# is used so all nodes agree on the refill rate.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local partial = tonumber(ARGV[4])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(state[1]) or burst
+local timestamp = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - timestamp) * rate)
+
+local granted = 0
+if tokens >= requested then
+    granted = requested
+elseif partial == 1 then
+    granted = math.floor(tokens)
+end
+tokens = tokens - granted
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "timestamp", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 1)
+return granted
+"""
+
+
+class TokenBucket:
+    """
+    Token bucket shared by every process through Redis.
+
+    ``rate`` tokens are added per second up to ``burst``. When the cache is
+    not Redis or Redis is unreachable the bucket allows every call, so rate
+    limiting never becomes a point of failure.
+    """
+
+    def __init__(self, key, rate, burst, alias="default"):
+        self.key = key
+        self.rate = rate
+        self.burst = burst
+        self.alias = alias
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            from django_redis import get_redis_connection
+
+            self._script = get_redis_connection(self.alias).register_script(
+                TOKEN_BUCKET_SCRIPT
+            )
+        return self._script
+
+    def _take(self, tokens, partial):
+        try:
+            script = self._get_script()
+            return int(
+                script(
+                    keys=[self.key],
+                    args=[self.rate, self.burst, tokens, int(partial)],
+                )
+            )
+        except NotImplementedError:
+            return tokens
+        except Exception as e:
+            logger.error(f"Rate limiter unavailable: {str(e)}")
+            return tokens
+
+    def acquire(self, tokens=1):
+        """Take ``tokens`` from the bucket, returning whether that was allowed."""
+        return self._take(tokens, partial=False) == tokens
+
+    def acquire_up_to(self, tokens):
+        """
+        Take up to ``tokens`` from the bucket, returning how many were taken.
+
+        Unlike ``acquire`` this never waits for more than ``burst`` tokens,
+        which the bucket can never hold.
+        """
+        return self._take(tokens, partial=True)
+
+
+def get_translation_rate_limiter(backend_name):
+    """
+    Return the token bucket for outbound calls to a translation backend.
+
+    Configured through ``FAQ_SETTINGS["TRANSLATION_RATE_LIMIT"]`` with
+    ``RATE`` (calls per second) and ``BURST``; ``None`` disables limiting.
+    """
+    config = getattr(settings, "FAQ_SETTINGS", {}).get("TRANSLATION_RATE_LIMIT")
+    if not config:
+        return None
+    return TokenBucket(
+        f"translation_rate_limit:{backend_name}", config["RATE"], config["BURST"]
+    )
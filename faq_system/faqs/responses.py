@@ -0,0 +1,122 @@
+import gzip
+import hashlib
+import re
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import (
+    add_never_cache_headers,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from rest_framework.renderers import JSONRenderer
+
+_GZIP_RE = re.compile(r"\bgzip\b")
+
+
+def make_etag(value):
+    """Return a quoted ETag for a string or bytes value."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return f'"{hashlib.sha256(value).hexdigest()[:32]}"'
+
+
+def render_json(data, etag=None):
+    """
+    Render data to a cacheable JSON entry.
+
+    Returns a dict with the ``content_type``, the ``etag`` (a hash of the
+    body unless given) and the rendered body, either as ``body`` or, when it
+    is at least ``CACHE_GZIP_MIN_SIZE`` bytes long, only ``gzip`` compressed
+    (``None`` disables compression). Keeping a single copy saves cache memory
+    and keeps the cache from compressing the entry a second time.
+    """
+    renderer = JSONRenderer()
+    body = renderer.render(data)
+    entry = {
+        "body": body,
+        "content_type": renderer.media_type,
+        "etag": etag or make_etag(body),
+        "gzip": None,
+    }
+    min_size = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_GZIP_MIN_SIZE", 1024)
+    if min_size is not None and len(body) >= min_size:
+        entry["gzip"] = gzip.compress(body)
+        entry["body"] = None
+    return entry
+
+
+def entry_body(entry):
+    """Return the uncompressed body of an entry made by ``render_json``."""
+    if entry["body"] is None:
+        return gzip.decompress(entry["gzip"])
+    return entry["body"]
+
+
+def json_response(request, entry, status=200):
+    """
+    Build a response straight from an entry made by ``render_json``.
+
+    The compressed body is sent to clients that accept gzip, so a cache hit
+    needs neither the serializer nor a renderer; other clients get it
+    decompressed.
+    """
+    accepts_gzip = _GZIP_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    if entry["gzip"] is not None and accepts_gzip:
+        response = HttpResponse(
+            entry["gzip"], content_type=entry["content_type"], status=status
+        )
+        response["Content-Encoding"] = "gzip"
+        # Weak, as the compressed bytes differ from the identity body
+        response["ETag"] = f"W/{entry['etag']}"
+    else:
+        response = HttpResponse(
+            entry_body(entry), content_type=entry["content_type"], status=status
+        )
+        response["ETag"] = entry["etag"]
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def mark_uncacheable(response):
+    """
+    Keep a response out of browser, proxy and page caches.
+
+    Used for fallback content, such as the English list served while a
+    translation is still running, which must not outlive the request.
+    """
+    add_never_cache_headers(response)
+    return response
+
+
+def is_uncacheable(response):
+    return "no-store" in response.get("Cache-Control", "")
+
+
+def patch_proxy_headers(request, response, surrogate_keys):
+    """
+    Mark a response as cacheable by browsers and a reverse proxy or CDN.
+
+    Anonymous responses are public for ``CACHE_CONTROL_MAX_AGE`` seconds in
+    browsers and ``SURROGATE_MAX_AGE`` seconds in the proxy, which is purged
+    by the ``Surrogate-Key`` tags when FAQs change. Responses for signed-in
+    users are private, and ``no-store`` responses also lose their validators,
+    which describe the content their URL normally has.
+    """
+    if is_uncacheable(response):
+        for header in ("ETag", "Last-Modified"):
+            if response.has_header(header):
+                del response[header]
+        return response
+    if request.user.is_authenticated:
+        patch_cache_control(response, private=True)
+        return response
+    faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+    patch_cache_control(
+        response, public=True, max_age=faq_settings.get("CACHE_CONTROL_MAX_AGE", 60)
+    )
+    response["Surrogate-Control"] = (
+        f"max-age={faq_settings.get('SURROGATE_MAX_AGE', 60 * 60 * 24)}"
+    )
+    response["Surrogate-Key"] = " ".join(surrogate_keys)
+    return response
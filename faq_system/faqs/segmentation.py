@@ -0,0 +1,133 @@
+import html
+import re
+
+_TAG_RE = re.compile(r"(<!--.*?-->|<[^>]*>)", re.DOTALL)
+_SKIP_TAG_RE = re.compile(r"<\s*(/?)\s*(script|style|code|pre)\b", re.IGNORECASE)
+_EDGE_WHITESPACE_RE = re.compile(r"^(\s*)(.*?)(\s*)$", re.DOTALL)
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?\u0964])(\s+)")
+
+
+def _sentence_pieces(text, max_size):
+    """Yield ``(piece, separator)`` pairs with no piece over ``max_size``."""
+    parts = _SENTENCE_BREAK_RE.split(text)
+    for sentence, separator in zip(parts[::2], parts[1::2] + [""]):
+        while len(sentence) > max_size:
+            cut = sentence.rfind(" ", 0, max_size + 1)
+            if cut > 0:
+                yield sentence[:cut], " "
+                sentence = sentence[cut + 1 :]
+            else:
+                yield sentence[:max_size], ""
+                sentence = sentence[max_size:]
+        yield sentence, separator
+
+
+def split_long_text(text, max_size):
+    """
+    Split text into chunks of at most ``max_size`` characters.
+
+    Chunks end at sentence boundaries where possible and a sentence that is
+    too long on its own is cut at a space. Returns ``(text, is_translatable)``
+    pairs with the whitespace between chunks kept as markup, so joining the
+    pairs gives back the original text.
+    """
+    if not max_size or len(text) <= max_size:
+        return [(text, True)]
+
+    chunks = []
+    current = gap = ""
+    for piece, separator in _sentence_pieces(text, max_size):
+        if current and len(current) + len(gap) + len(piece) > max_size:
+            chunks.append((current, True))
+            if gap:
+                chunks.append((gap, False))
+            current = piece
+        else:
+            current += gap + piece
+        gap = separator
+    chunks.append((current, True))
+    return chunks
+
+
+def split_sentences(text, max_size=None):
+    """
+    Split text into one translatable segment per sentence.
+
+    Sentences longer than ``max_size`` are cut at a space. The whitespace
+    between sentences is kept as markup.
+    """
+    segments = []
+    for piece, separator in _sentence_pieces(text, max_size or len(text)):
+        segments.append((piece, True))
+        if separator:
+            segments.append((separator, False))
+    return segments
+
+
+def split_segments(document, max_chunk_size=None, sentences=False):
+    """
+    Split an HTML document into markup and translatable text segments.
+
+    Returns a list of ``(text, is_translatable)`` pairs in document order.
+    Translatable segments are HTML-unescaped plain text. Text inside
+    ``script``, ``style``, ``code`` and ``pre`` elements and whitespace-only
+    text is left as markup.
+    Translatable text has its leading and trailing whitespace split off into
+    separate markup segments, and text longer than ``max_chunk_size`` is
+    split into several segments at sentence boundaries. With ``sentences``
+    every sentence becomes a segment of its own.
+    """
+    split_text = split_sentences if sentences else split_long_text
+    segments = []
+    skip_depth = 0
+    for index, part in enumerate(_TAG_RE.split(document)):
+        if not part:
+            continue
+        if index % 2:
+            match = _SKIP_TAG_RE.match(part)
+            if match and not part.endswith("/>"):
+                skip_depth = max(skip_depth + (-1 if match.group(1) else 1), 0)
+            segments.append((part, False))
+            continue
+        if skip_depth or not part.strip():
+            segments.append((part, False))
+            continue
+
+        leading, text, trailing = _EDGE_WHITESPACE_RE.match(part).groups()
+        if leading:
+            segments.append((leading, False))
+        segments.extend(split_text(html.unescape(text), max_chunk_size))
+        if trailing:
+            segments.append((trailing, False))
+    return segments
+
+
+def translatable_segments(document, max_chunk_size=None, sentences=False):
+    """Return the plain-text segments of a document that need translation."""
+    return [
+        text
+        for text, translatable in split_segments(document, max_chunk_size, sentences)
+        if translatable
+    ]
+
+
+def join_segments(document, translations, max_chunk_size=None, sentences=False):
+    """
+    Rebuild a document with its translatable segments replaced.
+
+    Args:
+        document (str): Source HTML
+        translations (dict): Maps source segment text to its translation
+        max_chunk_size (int): Chunk size the segments were translated with
+        sentences (bool): Whether the segments were split per sentence
+
+    Returns:
+        str: HTML with the original markup and translated text
+    """
+    parts = []
+    for text, translatable in split_segments(document, max_chunk_size, sentences):
+        if translatable:
+            parts.append(html.escape(translations.get(text, text), quote=False))
+        else:
+            parts.append(text)
+    return "".join(parts)
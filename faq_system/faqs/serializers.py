@@ -1,6 +1,19 @@
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import FAQ
+from .caching import invalidate_faq_cache
+from .models import FAQ, TranslationJob
+
+
+class FAQListSerializer(serializers.ListSerializer):
+    """Create many FAQs with one insert and queue their translations."""
+
+    def create(self, validated_data):
+        faqs = FAQ.objects.bulk_create([FAQ(**item) for item in validated_data])
+        # bulk_create bypasses FAQ.save, which invalidates single writes
+        invalidate_faq_cache(faq_ids=[faq.pk for faq in faqs])
+        transaction.on_commit(lambda: TranslationJob.objects.enqueue(faqs))
+        return faqs
 
 
 class FAQSerializer(serializers.ModelSerializer):
@@ -18,6 +31,7 @@ class FAQSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        list_serializer_class = FAQListSerializer
 
     def get_translated_question(self, obj):
         lang = self.context.get("lang", "en")
@@ -1,10 +1,47 @@
+import gzip
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import StringIO
+import json
+import os
+import threading
+import time
+from unittest import mock
+
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
-from django.test import Client, TestCase
+from django.core.management import call_command, CommandError
+from django.test import Client, override_settings, TestCase
 from django.urls import reverse
+from django_redis import get_redis_connection
 from rest_framework import status
 
-from .models import FAQ
+from . import cache_backends, caching, purge, views
+from .compressors import ZlibCompressor
+from .management.commands.warm_translations import (
+    Command as WarmTranslationsCommand,
+)
+from .models import FAQ, FAQTranslation, TranslationJob, TranslationMemory
+from .ratelimit import TokenBucket
+from .segmentation import (
+    join_segments,
+    split_long_text,
+    split_segments,
+    translatable_segments,
+)
+from .serializers import FAQSerializer
+from .translation import (
+    BaseTranslationBackend,
+    CircuitBreaker,
+    get_circuit_breaker,
+    get_translation_backend,
+    HedgedTranslationBackend,
+    LocalTranslationBackend,
+    translate_concurrently,
+    translation_digest,
+    TranslationError,
+    TranslationRateLimited,
+)
 
 
 class FAQViewTests(TestCase):
@@ -35,7 +72,7 @@ class FAQViewTests(TestCase):
         """Test that anonymous users can view FAQs"""
         response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(len(response.data) > 0)
+        self.assertTrue(len(response.json()) > 0)
 
     def test_create_view_authenticated(self):
         """Test that authenticated users can create FAQs"""
@@ -69,3 +106,1365 @@ class FAQViewTests(TestCase):
         response = self.client.delete(self.detail_url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(FAQ.objects.count(), 0)
+
+    def test_update_invalidates_cached_list(self):
+        """Test that a cached list is not served after an update"""
+        self.client.get(self.list_url)
+        self.client.login(username="admin", password="adminpass123")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(
+                self.detail_url,
+                {"question": "Updated question?", "answer": "Updated answer."},
+                content_type="application/json",
+            )
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.json()[0]["question"], "Updated question?")
+
+    def test_cache_hit_returns_rendered_bytes(self):
+        """Test that a cached list is served without serializing or rendering"""
+        first = self.client.get(self.list_url)
+        with mock.patch(
+            "rest_framework.renderers.JSONRenderer.render"
+        ) as render, mock.patch.object(FAQSerializer, "to_representation") as serialize:
+            second = self.client.get(self.list_url)
+
+        render.assert_not_called()
+        serialize.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    @override_settings(FAQ_SETTINGS={**settings.FAQ_SETTINGS, "CACHE_GZIP_MIN_SIZE": 0})
+    def test_cached_response_is_gzipped_when_accepted(self):
+        """Test that clients accepting gzip get the precompressed body"""
+        response = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content))[0]["question"],
+            self.faq.question,
+        )
+
+    @override_settings(FAQ_SETTINGS={**settings.FAQ_SETTINGS, "CACHE_GZIP_MIN_SIZE": 0})
+    def test_compressed_entry_is_served_to_identity_clients(self):
+        """Test that clients without gzip get the body of a compressed-only entry"""
+        self.client.get(self.list_url, HTTP_ACCEPT_ENCODING="gzip")
+        response = self.client.get(self.list_url)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.json()[0]["question"], self.faq.question)
+
+        response = self.client.get(self.list_url, HTTP_ACCEPT="text/html")
+        self.assertContains(response, self.faq.question)
+
+    def test_unchanged_list_returns_not_modified(self):
+        """Test that a matching If-None-Match gets a 304 without queries"""
+        etag = self.client.get(self.list_url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.save()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unmodified_detail_and_page_return_not_modified(self):
+        """Test that If-Modified-Since is honoured by the detail and page views"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.save()
+        last_modified = self.client.get(self.detail_url)["Last-Modified"]
+        response = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        etag = self.client.get(reverse("faq_list"))["ETag"]
+        response = self.client.get(reverse("faq_list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_browsable_api_is_still_rendered(self):
+        """Test that HTML clients still get the browsable API"""
+        response = self.client.get(self.list_url, HTTP_ACCEPT="text/html")
+        self.assertContains(response, "Is it free for everyone?")
+
+
+def fake_backend():
+    """Patch the local backend to record calls and tag texts with the language"""
+    return mock.patch.object(
+        LocalTranslationBackend,
+        "atranslate_many",
+        autospec=True,
+        side_effect=lambda self, texts, lang: [f"{lang}:{t}" for t in texts],
+    )
+
+
+LOCAL_FAQ_SETTINGS = {
+    **settings.FAQ_SETTINGS,
+    "TRANSLATION_BACKEND": {
+        "BACKEND": "faqs.translation.LocalTranslationBackend",
+        "OPTIONS": {},
+    },
+    "TRANSLATION_RATE_LIMIT": None,
+}
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+class FAQTranslationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faq = FAQ.objects.create(
+            question="Is it free for everyone?", answer="Yes, its free for everyone."
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_translations_are_stored(self):
+        """Test that translated fields are persisted as FAQTranslation rows"""
+        content = self.faq.get_translated_content("hi")
+
+        self.assertEqual(content["question"], "[hi] Is it free for everyone?")
+        self.assertEqual(
+            FAQTranslation.objects.filter(faq=self.faq, lang="hi").count(), 2
+        )
+
+    def test_stored_translations_survive_cache_flush(self):
+        """Test that prefetched translations are served without translating"""
+        self.faq.get_translated_content("hi")
+        cache.clear()
+
+        faq = FAQ.objects.with_translations("hi").get(pk=self.faq.pk)
+        with fake_backend() as translate_many:
+            content = faq.get_translated_content("hi")
+
+        translate_many.assert_not_called()
+        self.assertEqual(content["answer"], "[hi] Yes, its free for everyone.")
+
+    def test_outdated_translation_is_refreshed(self):
+        """Test that editing a field invalidates its stored translation"""
+        self.faq.get_translated_content("hi")
+        self.faq.question = "Is it still free?"
+        self.faq.save()
+        faq = FAQ.objects.with_translations("hi").get(pk=self.faq.pk)
+        content = faq.get_translated_content("hi")
+
+        self.assertEqual(content["question"], "[hi] Is it still free?")
+        self.assertEqual(
+            FAQTranslation.objects.filter(faq=self.faq, lang="hi").count(), 2
+        )
+
+    def test_translate_batch_groups_by_language(self):
+        """Test that batch translation makes one backend call per language"""
+        other = FAQ.objects.create(
+            question="Can I cancel?", answer="Yes, its free for everyone."
+        )
+        items = [
+            (faq, field, lang)
+            for faq in (self.faq, other)
+            for field in ("question", "answer")
+            for lang in ("hi", "bn")
+        ]
+        with fake_backend() as translate_many:
+            stored = FAQTranslation.objects.translate_batch(items)
+
+        self.assertEqual(translate_many.call_count, 2)
+        # The shared answer is only sent to the backend once per language
+        self.assertEqual(len(translate_many.call_args_list[0].args[1]), 3)
+        self.assertEqual(len(stored), 8)
+        self.assertEqual(FAQTranslation.objects.count(), 8)
+
+
+class LocalTranslationBackendTests(TestCase):
+    def test_translation_is_deterministic(self):
+        """Test that the local backend returns stable output"""
+        backend = LocalTranslationBackend()
+        self.assertEqual(backend.translate_many(["a", "b"], "hi"), ["[hi] a", "[hi] b"])
+
+    def test_error_rate_raises_translation_error(self):
+        """Test that a full error rate always fails"""
+        backend = LocalTranslationBackend(error_rate=1)
+        with self.assertRaises(TranslationError):
+            backend.translate("a", "hi")
+
+    @override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+    def test_backend_is_loaded_from_settings(self):
+        """Test that TRANSLATION_BACKEND selects the backend class"""
+        self.assertIsInstance(get_translation_backend(), LocalTranslationBackend)
+
+
+class ConcurrentTranslationTests(TestCase):
+    @override_settings(
+        FAQ_SETTINGS={
+            **LOCAL_FAQ_SETTINGS,
+            "TRANSLATION_BACKEND": {
+                "BACKEND": "faqs.translation.LocalTranslationBackend",
+                "OPTIONS": {"LATENCY": 0.2, "MAX_BATCH_SIZE": 1},
+            },
+        }
+    )
+    def test_requests_run_concurrently(self):
+        """Test that all language and batch requests are sent at once"""
+        started = time.monotonic()
+        results = translate_concurrently([(["a", "b"], "hi"), (["c"], "bn")])
+
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(results, [["[hi] a", "[hi] b"], ["[bn] c"]])
+
+    @override_settings(
+        FAQ_SETTINGS={
+            **LOCAL_FAQ_SETTINGS,
+            "TRANSLATION_BACKEND": {
+                "BACKEND": "faqs.translation.LocalTranslationBackend",
+                "OPTIONS": {"LATENCY": 5},
+            },
+            "TRANSLATION_DEADLINE": 0.1,
+        }
+    )
+    def test_deadline_abandons_slow_requests(self):
+        """Test that requests past the deadline fail instead of blocking"""
+        started = time.monotonic()
+        (result,) = translate_concurrently([(["a"], "hi")])
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertIsInstance(result[0], TranslationError)
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+class TranslationJobTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin_user = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="adminpass123"
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_save_enqueues_jobs(self):
+        """Test that saving a FAQ queues a job per non-English language"""
+        with self.captureOnCommitCallbacks(execute=True):
+            faq = FAQ.objects.create(question="Question?", answer="Answer.")
+
+        jobs = TranslationJob.objects.filter(faq=faq)
+        self.assertEqual(sorted(jobs.values_list("lang", flat=True)), ["bn", "hi"])
+
+    def test_bulk_create_enqueues_jobs(self):
+        """Test that the bulk create endpoint queues jobs for every FAQ"""
+        self.client.login(username="admin", password="adminpass123")
+        data = [
+            {"question": "First?", "answer": "One."},
+            {"question": "Second?", "answer": "Two."},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("faq-bulk-create"), data, content_type="application/json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(TranslationJob.objects.count(), 4)
+
+    def test_worker_processes_queue(self):
+        """Test that the worker translates queued FAQs and finishes the jobs"""
+        with self.captureOnCommitCallbacks(execute=True):
+            faq = FAQ.objects.create(question="Question?", answer="Answer.")
+
+        call_command("translation_worker", once=True, concurrency=1, stdout=StringIO())
+
+        self.assertFalse(
+            TranslationJob.objects.exclude(status=TranslationJob.DONE).exists()
+        )
+        self.assertEqual(FAQTranslation.objects.filter(faq=faq).count(), 4)
+
+    def test_claimed_jobs_prefetch_translations(self):
+        """Test that checking claimed FAQs for missing translations needs no queries"""
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(3):
+                FAQ.objects.create(question=f"Question {index}?", answer="Answer.")
+
+        jobs = TranslationJob.objects.claim(10)
+        self.assertEqual(len(jobs), 6)
+        with self.assertNumQueries(0):
+            for job in jobs:
+                job.faq.get_missing_translations(job.lang)
+
+    def test_worker_replaces_cached_fallback(self):
+        """Test that finished jobs invalidate English served during an outage"""
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQ.objects.create(question="Question?", answer="Answer.")
+        with mock.patch.object(
+            FAQTranslation.objects, "translate_batch", return_value=[]
+        ):
+            fallback = self.client.get(reverse("faq-list"), {"lang": "hi"})
+        self.assertEqual(fallback.json()[0]["translated_question"], "Question?")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "translation_worker", once=True, concurrency=1, stdout=StringIO()
+            )
+
+        response = self.client.get(
+            reverse("faq-list"), {"lang": "hi"}, HTTP_IF_NONE_MATCH=fallback["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["translated_question"], "[hi] Question?")
+        self.assertNotEqual(response["ETag"], fallback["ETag"])
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+class TranslationMemoryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_digest_is_stable_and_normalized(self):
+        """Test that equivalent texts share a content address"""
+        self.assertEqual(
+            translation_digest("Is it  free?\n", "hi", "local"),
+            translation_digest("Is it free?", "hi", "local"),
+        )
+        self.assertNotEqual(
+            translation_digest("Is it free?", "hi", "local"),
+            translation_digest("Is it free?", "bn", "local"),
+        )
+
+    def test_identical_texts_are_translated_once(self):
+        """Test that the memory dedupes texts and survives a cache flush"""
+        with fake_backend() as translate_many:
+            TranslationMemory.objects.translate(["Same answer.", "Same answer."], "hi")
+            cache.clear()
+            result = TranslationMemory.objects.translate(["Same answer."], "hi")
+
+        self.assertEqual(translate_many.call_count, 1)
+        self.assertEqual(result, ["hi:Same answer."])
+        self.assertEqual(TranslationMemory.objects.count(), 1)
+
+    def test_concurrent_misses_are_translated_once(self):
+        """Test that a caller missing texts translated elsewhere waits for them"""
+        manager = TranslationMemory.objects
+        digest = translation_digest("Busy.", "hi", "local")
+        cache.add(f"{manager._flight_key([digest])}:lock", "other", timeout=30)
+        threading.Timer(0.1, manager._warm_cache, [{digest: "hi:Busy."}]).start()
+
+        with fake_backend() as translate_many:
+            result = manager.translate(["Busy."], "hi")
+
+        translate_many.assert_not_called()
+        self.assertEqual(result, ["hi:Busy."])
+
+    @override_settings(
+        FAQ_SETTINGS={
+            **LOCAL_FAQ_SETTINGS,
+            "TRANSLATION_BACKEND": {
+                "BACKEND": "faqs.translation.LocalTranslationBackend",
+                "OPTIONS": {"MAX_BATCH_SIZE": 2},
+            },
+        }
+    )
+    def test_successful_batches_are_kept(self):
+        """Test that a failed batch neither discards nor backs off the others"""
+
+        def translate(backend, texts, lang):
+            if "Bad." in texts:
+                raise TranslationError("Rejected")
+            return [f"{lang}:{text}" for text in texts]
+
+        texts = ["One.", "Two.", "Bad.", "Three."]
+        with mock.patch.object(
+            LocalTranslationBackend,
+            "atranslate_many",
+            autospec=True,
+            side_effect=translate,
+        ):
+            result = TranslationMemory.objects.translate_languages({"hi": texts})
+
+        self.assertEqual(result["hi"][:2], ["hi:One.", "hi:Two."])
+        self.assertIsInstance(result["hi"][2], TranslationError)
+        self.assertEqual(TranslationMemory.objects.count(), 2)
+        self.assertEqual(
+            TranslationMemory.objects._in_backoff(
+                [translation_digest(text, "hi", "local") for text in texts]
+            ),
+            {translation_digest(text, "hi", "local") for text in ("Bad.", "Three.")},
+        )
+
+    def test_hit_rate_is_counted(self):
+        """Test that memory hits and misses are counted"""
+        TranslationMemory.objects.translate(["One.", "Two."], "hi")
+        TranslationMemory.objects.translate(["One."], "hi")
+
+        stats = TranslationMemory.objects.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 3)
+
+    def test_shared_sentences_are_translated_once(self):
+        """Test that a sentence repeated across answers reaches the backend once"""
+        with fake_backend() as translate_many:
+            TranslationMemory.objects.translate_documents(
+                ["<p>It is free. Email us for help.</p>"], "hi"
+            )
+            result = TranslationMemory.objects.translate_documents(
+                ["<p>It costs money. Email us for help.</p>"], "hi"
+            )
+
+        self.assertEqual(translate_many.call_args.args[1], ["It costs money."])
+        self.assertEqual(result, ["<p>hi:It costs money. hi:Email us for help.</p>"])
+        stats = TranslationMemory.objects.stats()
+        self.assertEqual(stats["saved_chars"], len("Email us for help."))
+        self.assertEqual(
+            stats["sent_chars"], len("It is free.Email us for help.It costs money.")
+        )
+
+
+class SegmentationTests(TestCase):
+    document = (
+        "<p>Yes, it is <strong>free</strong> &amp; open.</p>\n"
+        "<pre>code stays</pre><p> Contact us. </p>"
+    )
+
+    def test_split_segments(self):
+        """Test that text nodes are split from markup and unescaped"""
+        self.assertEqual(
+            "".join(text for text, _ in split_segments(self.document)),
+            "<p>Yes, it is <strong>free</strong> & open.</p>\n"
+            "<pre>code stays</pre><p> Contact us. </p>",
+        )
+        self.assertEqual(
+            translatable_segments(self.document),
+            ["Yes, it is", "free", "& open.", "Contact us."],
+        )
+
+    def test_markup_is_preserved(self):
+        """Test that only text nodes are replaced when rebuilding"""
+        translated = join_segments(
+            self.document, {"free": "muft", "& open.": "& khula."}
+        )
+        self.assertEqual(
+            translated,
+            "<p>Yes, it is <strong>muft</strong> &amp; khula.</p>\n"
+            "<pre>code stays</pre><p> Contact us. </p>",
+        )
+
+    @override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+    def test_edit_retranslates_only_changed_segment(self):
+        """Test that fixing a typo costs a single segment translation"""
+        cache.clear()
+        TranslationMemory.objects.translate_documents(
+            ["<p>First paragraph.</p><p>Secnd paragraph.</p>"], "hi"
+        )
+        with fake_backend() as translate_many:
+            result = TranslationMemory.objects.translate_documents(
+                ["<p>First paragraph.</p><p>Second paragraph.</p>"], "hi"
+            )
+        cache.clear()
+
+        translate_many.assert_called_once()
+        self.assertEqual(translate_many.call_args.args[1], ["Second paragraph."])
+        self.assertEqual(
+            result,
+            ["<p>[hi] First paragraph.</p><p>hi:Second paragraph.</p>"],
+        )
+
+    def test_long_text_is_chunked_at_sentences(self):
+        """Test that long text splits at sentence ends and rejoins exactly"""
+        text = "One two three. Four five six! Seven eight nine ten eleven twelve."
+        chunks = split_long_text(text, 28)
+        self.assertEqual(
+            [chunk for chunk, translatable in chunks if translatable],
+            [
+                "One two three.",
+                "Four five six!",
+                "Seven eight nine ten eleven",
+                "twelve.",
+            ],
+        )
+        self.assertTrue(all(len(chunk) <= 28 for chunk, _ in chunks))
+        self.assertEqual("".join(chunk for chunk, _ in chunks), text)
+
+    @override_settings(
+        FAQ_SETTINGS={
+            **LOCAL_FAQ_SETTINGS,
+            "TRANSLATION_MAX_CHUNK_SIZE": 20,
+            "TRANSLATION_MAX_BATCH_CHARS": 20,
+        }
+    )
+    def test_long_answer_chunks_are_translated_separately(self):
+        """Test that chunks of a long answer go out as parallel calls"""
+        cache.clear()
+        with fake_backend() as translate_many:
+            result = TranslationMemory.objects.translate_documents(
+                ["<p>First sentence. Second sentence.</p>"], "hi"
+            )
+        cache.clear()
+
+        self.assertEqual(translate_many.call_count, 2)
+        self.assertEqual(result, ["<p>hi:First sentence. hi:Second sentence.</p>"])
+
+
+LOCAL_PURGE_FAQ_SETTINGS = {
+    **LOCAL_FAQ_SETTINGS,
+    "PURGE_BACKEND": {"BACKEND": "faqs.purge.LocalPurgeBackend", "OPTIONS": {}},
+}
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_PURGE_FAQ_SETTINGS)
+class ProxyCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        purge.outbox.clear()
+        self.faq = FAQ.objects.create(question="Is it free?", answer="Yes.")
+        User.objects.create_superuser("admin", "admin@example.com", "adminpass123")
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_anonymous_responses_carry_surrogate_keys(self):
+        """Test that proxy headers tag responses by list, FAQ and language"""
+        response = self.client.get(reverse("faq-list"), {"lang": "hi"})
+        self.assertIn("public", response["Cache-Control"])
+        self.assertEqual(response["Surrogate-Key"], "faqs lang-hi")
+        self.assertEqual(response["Surrogate-Control"], "max-age=86400")
+
+        response = self.client.get(reverse("faq-detail", args=[self.faq.pk]))
+        self.assertEqual(response["Surrogate-Key"], f"faq-{self.faq.pk} lang-en")
+
+        response = self.client.get(reverse("faq_list"))
+        self.assertEqual(response["Surrogate-Key"], "faqs lang-en")
+
+    def test_edit_rerenders_only_changed_fragment(self):
+        """Test that the list page reuses cached fragments of unchanged FAQs"""
+        other = FAQ.objects.create(question="Is it open?", answer="Yes.")
+        self.client.get(reverse("faq_list"))
+        other.question = "Is it open source?"
+        with self.captureOnCommitCallbacks(execute=True):
+            other.save()
+
+        with mock.patch(
+            "faqs.views.render_to_string", wraps=views.render_to_string
+        ) as render:
+            response = self.client.get(reverse("faq_list"))
+
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(render.call_args.args[1]["faq"]["id"], other.pk)
+        self.assertContains(response, "Is it open source?")
+        self.assertContains(response, "Is it free?")
+
+    def test_signed_in_responses_are_private(self):
+        """Test that pages for signed-in users are not cached by the proxy"""
+        edit_url = reverse("faq_edit", args=[self.faq.pk])
+        self.assertNotContains(self.client.get(reverse("faq_list")), edit_url)
+        self.client.login(username="admin", password="adminpass123")
+        response = self.client.get(reverse("faq_list"))
+        self.assertContains(response, edit_url)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertFalse(response.has_header("Surrogate-Key"))
+
+    def test_writes_purge_the_proxy(self):
+        """Test that API, HTML and admin writes purge the affected keys once"""
+        self.client.login(username="admin", password="adminpass123")
+        writes = [
+            lambda: self.client.patch(
+                reverse("faq-detail", args=[self.faq.pk]),
+                {"answer": "No."},
+                content_type="application/json",
+            ),
+            lambda: self.client.post(
+                reverse("faq_edit", args=[self.faq.pk]),
+                {"question": "Is it free?", "answer": "Maybe."},
+            ),
+            lambda: self.client.post(
+                reverse("admin:faqs_faq_delete", args=[self.faq.pk]), {"post": "yes"}
+            ),
+        ]
+        for write in writes:
+            purge.outbox.clear()
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+            self.assertEqual(purge.outbox.count(f"faq-{self.faq.pk}"), 1)
+            self.assertEqual(purge.outbox.count("faqs"), 1)
+        self.assertFalse(FAQ.objects.exists())
+
+        purge.outbox.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("faq-bulk-create"),
+                [
+                    {"question": "One?", "answer": "1"},
+                    {"question": "Two?", "answer": "2"},
+                ],
+                content_type="application/json",
+            )
+        for faq in response.json():
+            self.assertIn(f"faq-{faq['id']}", purge.outbox)
+        self.assertEqual(purge.outbox.count("faqs"), 1)
+
+    def test_http_purge_backend_sends_keys(self):
+        """Test that the HTTP backend sends the keys to the purge endpoint"""
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_PURGE(self):
+                received.append((self.path, self.headers["Surrogate-Key"]))
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.handle_request, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/purge"
+        purge.HTTPPurgeBackend(url).purge(["faq-1", "faqs"])
+        server.server_close()
+
+        self.assertEqual(received, [("/purge", "faq-1 faqs")])
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faq = FAQ.objects.create(question="Is it free?", answer="Yes.")
+        User.objects.create_superuser("admin", "admin@example.com", "adminpass123")
+        self.client.login(username="admin", password="adminpass123")
+        self.anonymous = Client()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_anonymous_page_is_served_before_the_view(self):
+        """Test that a cached anonymous page skips the view and the database"""
+        first = self.anonymous.get(reverse("faq_list"), {"lang": "hi"})
+        with mock.patch("faqs.views.render") as render, self.assertNumQueries(0):
+            second = self.anonymous.get(reverse("faq_list"), {"lang": "hi"})
+
+        render.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["Surrogate-Key"], "faqs lang-hi")
+        response = self.anonymous.get(
+            reverse("faq_list"), {"lang": "hi"}, HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_every_write_path_invalidates_the_page(self):
+        """Test that HTML, API and admin writes all refresh the cached page"""
+        writes = [
+            lambda: self.client.post(
+                reverse("faq_create"), {"question": "Created?", "answer": "Yes."}
+            ),
+            lambda: self.client.post(
+                reverse("faq_edit", args=[self.faq.pk]),
+                {"question": "Edited?", "answer": "Yes."},
+            ),
+            lambda: self.client.patch(
+                reverse("faq-detail", args=[self.faq.pk]),
+                {"question": "Patched?"},
+                content_type="application/json",
+            ),
+            lambda: self.client.post(
+                reverse("admin:faqs_faq_change", args=[self.faq.pk]),
+                {"question": "Admin edited?", "answer": "Yes."},
+            ),
+            lambda: self.client.post(
+                reverse("faq-bulk-create"),
+                [{"question": "Bulk created?", "answer": "Yes."}],
+                content_type="application/json",
+            ),
+            lambda: self.client.post(
+                reverse("faq_delete", args=[self.faq.pk]),
+            ),
+        ]
+        for write, expected in zip(
+            writes,
+            ["Created?", "Edited?", "Patched?", "Admin edited?", "Bulk created?", None],
+        ):
+            self.anonymous.get(reverse("faq_list"))
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+            response = self.anonymous.get(reverse("faq_list"))
+            if expected:
+                self.assertContains(response, expected)
+        self.assertNotContains(response, "Admin edited?")
+
+
+class CacheVersionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_bump_moves_only_affected_keys(self):
+        """Test that bumping a namespace changes only the keys built from it"""
+        detail = caching.versioned_key("faq:detail:1:hi", "faq:1", "lang:hi")
+        other = caching.versioned_key("faq:detail:2:hi", "faq:2", "lang:hi")
+        with self.captureOnCommitCallbacks(execute=True):
+            caching.invalidate_faq_cache(faq_ids=[1], lists=False)
+
+        self.assertNotEqual(
+            caching.versioned_key("faq:detail:1:hi", "faq:1", "lang:hi"), detail
+        )
+        self.assertEqual(
+            caching.versioned_key("faq:detail:2:hi", "faq:2", "lang:hi"), other
+        )
+
+    def test_invalidation_waits_for_commit(self):
+        """Test that readers keep the old generation until the write commits"""
+        key = caching.versioned_key("faq:detail:1:hi", "faq:1", "lang:hi")
+        with self.captureOnCommitCallbacks() as callbacks:
+            caching.invalidate_faq_cache(faq_ids=[1])
+        self.assertEqual(
+            caching.versioned_key("faq:detail:1:hi", "faq:1", "lang:hi"), key
+        )
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(
+            caching.versioned_key("faq:detail:1:hi", "faq:1", "lang:hi"), key
+        )
+
+    def test_delete_invalidates_after_the_row_is_gone(self):
+        """Test that readers cannot re-cache a FAQ after its invalidation"""
+        faq = FAQ.objects.create(question="Is it free?", answer="Yes.")
+        faq_id = faq.pk
+        exists = []
+        with mock.patch(
+            "faqs.models.invalidate_faq_cache",
+            side_effect=lambda **kwargs: exists.append(
+                FAQ.objects.filter(pk=faq_id).exists()
+            ),
+        ) as invalidate:
+            faq.delete()
+
+        invalidate.assert_called_once_with(faq_ids=[faq_id])
+        self.assertEqual(exists, [False])
+
+    def test_invalidation_deletes_tagged_entries(self):
+        """Test that every entry tagged with a FAQ is deleted with it"""
+        caching.set_with_stale("faq:detail:1:hi", "one", 60, tags=["faq:1", "lang:hi"])
+        caching.set_tagged("faq:content:1:bn", "one", 60, tags=["faq:1"])
+        caching.set_tagged("faq:content:2:bn", "two", 60, tags=["faq:2"])
+        with self.captureOnCommitCallbacks(execute=True):
+            caching.invalidate_faq_cache(faq_ids=[1], lists=False)
+
+        self.assertIsNone(cache.get("faq:detail:1:hi"))
+        self.assertIsNone(cache.get("faq:content:1:bn"))
+        self.assertEqual(cache.get("faq:content:2:bn"), "two")
+
+    @override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+    def test_tag_sets_do_not_grow_across_edits(self):
+        """Test that entries are not tagged with never-invalidated namespaces"""
+        faq = FAQ.objects.create(question="Is it free?", answer="Yes.")
+        for _ in range(3):
+            self.client.get(reverse("faq-list"), {"lang": "hi"})
+            self.client.get(reverse("faq_list"), {"lang": "hi"})
+            with self.captureOnCommitCallbacks(execute=True):
+                faq.save()
+
+        redis = get_redis_connection("default")
+        self.assertFalse(redis.exists(cache.make_key("faq:tag:lang:hi")))
+        self.assertFalse(redis.exists(cache.make_key(f"faq:tag:faq:{faq.pk}")))
+
+    def test_junk_requests_create_no_counters(self):
+        """Test that unknown ids and languages cannot fill Redis with counters"""
+        for lang in ("en", "xx1", "xx2"):
+            self.client.get(reverse("faq-list"), {"lang": lang})
+            self.client.get(reverse("faq-detail", args=[987654]), {"lang": lang})
+            self.client.get(reverse("faq-detail", args=["junk"]), {"lang": lang})
+
+        redis = get_redis_connection("default")
+        keys = set(redis.scan_iter(cache.make_key("faq:version:*")))
+        self.assertEqual(
+            keys,
+            {
+                cache.make_key(f"faq:version:{namespace}").encode("utf-8")
+                for namespace in ("list", "lang:en", "lang:other")
+            },
+        )
+
+    def test_admin_save_invalidates_cached_list(self):
+        """Test that saving through the admin refreshes the cached list"""
+        faq = FAQ.objects.create(question="Old question?", answer="Answer.")
+        self.client.get(reverse("faq_list"))
+        User.objects.create_superuser("admin", "admin@example.com", "adminpass123")
+        self.client.login(username="admin", password="adminpass123")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                reverse("admin:faqs_faq_change", args=[faq.pk]),
+                {"question": "New question?", "answer": "Answer."},
+            )
+        # A fresh client, as the admin's success message repeats the question
+        self.assertContains(Client().get(reverse("faq_list")), "New question?")
+
+    def test_lost_counter_does_not_revive_old_entries(self):
+        """Test that a recreated counter never reuses an older generation"""
+        before = caching.versioned_key("faq:list:en", "list")
+        caching.invalidate_faq_cache()
+        cache.clear()
+        time.sleep(0.002)
+        self.assertNotEqual(caching.versioned_key("faq:list:en", "list"), before)
+
+
+class LocalCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_entries_expire(self):
+        """Test that local entries are dropped after their timeout"""
+        local_cache = cache_backends.LocalCache(max_entries=10, timeout=0.05)
+        local_cache.set("faq:a", 1)
+        self.assertEqual(local_cache.get("faq:a"), (True, 1))
+        time.sleep(0.06)
+        self.assertEqual(local_cache.get("faq:a"), (False, None))
+
+    def test_admission_keeps_popular_entries(self):
+        """Test that a full cache only admits keys more popular than the victim"""
+        local_cache = cache_backends.LocalCache(max_entries=2, timeout=60)
+        for key in ("faq:a", "faq:b"):
+            local_cache.set(key, key)
+            for _ in range(3):
+                local_cache.get(key)
+        local_cache.set("faq:once", "once")
+        self.assertEqual(local_cache.get("faq:once"), (False, None))
+
+        for _ in range(5):
+            local_cache.get("faq:hot")
+        local_cache.set("faq:hot", "hot")
+        self.assertEqual(local_cache.get("faq:hot"), (True, "hot"))
+        self.assertEqual(len(local_cache), 2)
+
+    def test_hits_are_served_locally(self):
+        """Test that a repeated read of a FAQ key does not reach Redis"""
+        cache.set("faq:list:en", ["cached"])
+        with mock.patch("django_redis.client.DefaultClient.get") as redis_get:
+            self.assertEqual(cache.get("faq:list:en"), ["cached"])
+        redis_get.assert_not_called()
+
+    def test_invalidation_during_fetch_is_not_lost(self):
+        """Test that a value fetched before an invalidation is not kept locally"""
+        local_cache = cache_backends.get_local_cache()
+        local_key = cache.make_key("faq:version:list")
+
+        def fetch_then_invalidate(*args, **kwargs):
+            # The listener drops the key while the old value is in flight
+            local_cache.delete(local_key)
+            return 1
+
+        with mock.patch(
+            "django_redis.client.DefaultClient.get", side_effect=fetch_then_invalidate
+        ), mock.patch(
+            "django_redis.client.DefaultClient.get_many",
+            side_effect=lambda keys, **kwargs: fetch_then_invalidate() and {keys[0]: 1},
+        ):
+            self.assertEqual(cache.get("faq:version:list"), 1)
+            self.assertEqual(local_cache.get(local_key), (False, None))
+            cache.get_many(["faq:version:list"])
+            self.assertEqual(local_cache.get(local_key), (False, None))
+
+    def test_other_process_writes_are_broadcast(self):
+        """Test that invalidations published by another process drop local copies"""
+        cache.set("faq:list:en", ["old"])
+        redis = get_redis_connection("default")
+        redis.set(cache.make_key("faq:list:en"), cache.client.encode(["new"]))
+        deadline = time.monotonic() + 1
+        while cache.get("faq:list:en") != ["new"] and time.monotonic() < deadline:
+            # Repeat until the listener thread has subscribed
+            redis.publish(
+                cache_backends.INVALIDATION_CHANNEL,
+                '{"node": "other", "keys": ["%s"]}' % cache.make_key("faq:list:en"),
+            )
+            time.sleep(0.01)
+        self.assertEqual(cache.get("faq:list:en"), ["new"])
+
+
+class CacheCompressionTests(TestCase):
+    def test_only_large_values_are_compressed(self):
+        """Test that values below the threshold are stored uncompressed"""
+        compressor = ZlibCompressor({"COMPRESS_MIN_LENGTH": 100})
+        self.assertEqual(compressor.compress(b"x" * 100), b"x" * 100)
+        compressed = compressor.compress(b"x" * 1000)
+        self.assertLess(len(compressed), 100)
+        self.assertEqual(compressor.decompress(compressed), b"x" * 1000)
+
+    def test_compressed_values_are_stored_as_is(self):
+        """Test that values zlib cannot shrink are stored uncompressed"""
+        value = os.urandom(1000)
+        compressor = ZlibCompressor({"COMPRESS_MIN_LENGTH": 100})
+        self.assertEqual(compressor.compress(value), value)
+
+    def test_cache_round_trips_large_entries(self):
+        """Test that the configured cache stores and reads compressed entries"""
+        value = [{"id": index, "answer": "<p>Same answer.</p>"} for index in range(500)]
+        cache.set("faq:test", value)
+        raw = get_redis_connection("default").get(cache.make_key("faq:test"))
+        self.assertLess(len(raw), 2000)
+        cache_backends.get_local_cache().clear()
+        self.assertEqual(cache.get("faq:test"), value)
+        cache.delete("faq:test")
+
+    def test_benchmark_reports_each_encoding(self):
+        """Test that the benchmark reports size and timings per encoding"""
+        out = StringIO()
+        call_command("cache_benchmark", synthetic=50, repeat=1, stdout=out)
+        for name in ("pickle", "pickle+zlib"):
+            self.assertIn(name, out.getvalue())
+
+
+class StaleWhileRevalidateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_stale_entry_is_served_while_refreshing(self):
+        """Test that an expired entry is returned and refreshed once"""
+        caching.set_with_stale("faq:test", "old", timeout=-1)
+        with mock.patch.object(caching._refresh_executor, "submit") as submit:
+            first = caching.get_or_set_stale("faq:test", lambda: "new", timeout=60)
+            second = caching.get_or_set_stale("faq:test", lambda: "new", timeout=60)
+
+        self.assertEqual((first, second), ("old", "old"))
+        submit.assert_called_once()
+
+        caching._refresh(*submit.call_args.args[1:])
+        self.assertEqual(
+            caching.get_or_set_stale("faq:test", lambda: "newer", timeout=60), "new"
+        )
+
+    def test_fresh_entry_is_not_refreshed(self):
+        """Test that fresh entries are served without recomputation"""
+        caching.set_with_stale("faq:test", "cached", timeout=60)
+        with mock.patch.object(caching._refresh_executor, "submit") as submit:
+            value = caching.get_or_set_stale("faq:test", lambda: "new", timeout=60)
+
+        self.assertEqual(value, "cached")
+        submit.assert_not_called()
+
+    def test_expensive_entries_refresh_early(self):
+        """Test that entries are refreshed early in proportion to compute cost"""
+        entry = {"value": "cached", "fresh_until": 100.0, "delta": 2.0}
+        # -log(1 - 0.9) is about 2.3, so refreshes start ~4.6s before expiry
+        with mock.patch("faqs.caching.random.random", return_value=0.9):
+            self.assertTrue(caching.should_refresh(entry, now=96.0))
+            self.assertFalse(caching.should_refresh(entry, now=90.0))
+        with mock.patch("faqs.caching.random.random", return_value=0.0):
+            self.assertFalse(caching.should_refresh(entry, now=99.9))
+            self.assertTrue(caching.should_refresh(entry, now=100.0))
+
+    def test_compute_time_is_stored(self):
+        """Test that the time taken to compute a value is kept with it"""
+        caching.get_or_set_stale(
+            "faq:test", lambda: time.sleep(0.02) or "value", timeout=60
+        )
+        self.assertGreaterEqual(cache.get("faq:test")["delta"], 0.02)
+
+
+class SingleFlightTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def _single_flight(self, compute, fallback=None):
+        return caching.single_flight(
+            "faq:test",
+            compute,
+            lambda: cache.get("faq:test"),
+            lambda value: cache.set("faq:test", value),
+            fallback,
+        )
+
+    def test_waiter_reads_holder_result(self):
+        """Test that a caller waiting on the lock receives the stored result"""
+        cache.add("faq:test:lock", "other", timeout=30)
+        threading.Timer(0.1, lambda: cache.set("faq:test", "computed")).start()
+        compute = mock.Mock(return_value="recomputed")
+
+        self.assertEqual(self._single_flight(compute), "computed")
+        compute.assert_not_called()
+
+    @override_settings(FAQ_SETTINGS={**LOCAL_FAQ_SETTINGS, "SINGLE_FLIGHT_WAIT": 0.1})
+    def test_waiter_falls_back_after_deadline(self):
+        """Test that waiting past the deadline returns the fallback"""
+        cache.add("faq:test:lock", "other", timeout=30)
+
+        result = self._single_flight(lambda: "computed", fallback=lambda: "english")
+        self.assertEqual(result, "english")
+
+    @override_settings(FAQ_SETTINGS={**LOCAL_FAQ_SETTINGS, "SINGLE_FLIGHT_WAIT": 0.1})
+    def test_list_waiters_fall_back_to_english(self):
+        """Test that list waiters past the deadline get English without translating"""
+        FAQ.objects.create(question="Is it free?", answer="Yes.")
+        key = views.get_cache_key("list_data", lang="hi")
+        cache.add(f"{key}:lock", "other", timeout=30)
+
+        with fake_backend() as translate_many:
+            faqs, served_lang = views.get_faqs_with_translations("hi")
+
+        translate_many.assert_not_called()
+        self.assertEqual(faqs[0]["question"], "Is it free?")
+        self.assertEqual(served_lang, "en")
+        self.assertIsNone(cache.get(key))
+
+    @override_settings(FAQ_SETTINGS={**LOCAL_FAQ_SETTINGS, "SINGLE_FLIGHT_WAIT": 0.1})
+    def test_fallback_fragments_are_not_cached_as_translations(self):
+        """Test that a page rendered from the English fallback is not reused"""
+        FAQ.objects.create(question="Is it free?", answer="Yes.")
+        User.objects.create_superuser("admin", "admin@example.com", "adminpass123")
+        self.client.login(username="admin", password="adminpass123")
+        key = views.get_cache_key("list_data", lang="hi")
+        cache.add(f"{key}:lock", "other", timeout=30)
+        self.assertNotContains(
+            self.client.get(reverse("faq_list"), {"lang": "hi"}), "hi:Is it free?"
+        )
+
+        cache.delete(f"{key}:lock")
+        with fake_backend():
+            response = self.client.get(reverse("faq_list"), {"lang": "hi"})
+        self.assertContains(response, "hi:Is it free?")
+
+    @override_settings(FAQ_SETTINGS={**LOCAL_FAQ_SETTINGS, "SINGLE_FLIGHT_WAIT": 0.1})
+    def test_fallback_responses_are_not_cacheable(self):
+        """Test that English fallback pages and lists are kept out of every cache"""
+        FAQ.objects.create(question="Is it free?", answer="Yes.")
+        for name, prefix in (("faq_list", "list_data"), ("faq-list", "api_list")):
+            key = views.get_cache_key(prefix, lang="hi")
+            cache.add(f"{key}:lock", "other", timeout=30)
+            response = self.client.get(reverse(name), {"lang": "hi"})
+            self.assertIn("no-store", response["Cache-Control"])
+            self.assertNotIn("public", response["Cache-Control"])
+            for header in ("ETag", "Last-Modified", "Surrogate-Key"):
+                self.assertFalse(response.has_header(header))
+
+            cache.delete(f"{key}:lock")
+            with fake_backend():
+                response = self.client.get(reverse(name), {"lang": "hi"})
+            self.assertContains(response, "hi:Is it free?")
+            self.assertIn("public", response["Cache-Control"])
+
+    def test_expired_lock_is_taken_over(self):
+        """Test that a crashed holder's lock does not block other callers"""
+        cache.add("faq:test:lock", "crashed", timeout=1)
+
+        self.assertEqual(self._single_flight(lambda: "computed"), "computed")
+        self.assertIsNone(cache.get("faq:test:lock"))
+
+
+FAILING_FAQ_SETTINGS = {
+    **LOCAL_FAQ_SETTINGS,
+    "TRANSLATION_BACKEND": {
+        "BACKEND": "faqs.translation.LocalTranslationBackend",
+        "OPTIONS": {"ERROR_RATE": 1},
+    },
+    "CIRCUIT_BREAKER_THRESHOLD": 2,
+}
+
+
+@override_settings(FAQ_SETTINGS=FAILING_FAQ_SETTINGS)
+class TranslationFailureTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_failed_text_backs_off(self):
+        """Test that a failed text is not retried during its backoff"""
+        with self.assertRaises(TranslationError):
+            TranslationMemory.objects.translate(["Broken."], "hi")
+
+        with mock.patch.object(
+            LocalTranslationBackend, "atranslate_many", autospec=True
+        ) as translate_many:
+            with self.assertRaises(TranslationError):
+                TranslationMemory.objects.translate(["Broken."], "hi")
+        translate_many.assert_not_called()
+
+    @override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+    def test_backoff_skips_only_failed_texts(self):
+        """Test that texts backing off do not hold back other texts"""
+        TranslationMemory.objects._record_failures(
+            [translation_digest("Bad text.", "hi", "local")]
+        )
+
+        result = TranslationMemory.objects.translate_languages(
+            {"hi": ["Bad text.", "New text."]}
+        )["hi"]
+
+        self.assertIsInstance(result[0], TranslationError)
+        self.assertEqual(result[1], "[hi] New text.")
+
+    def test_lock_takeover_does_not_retry_failed_texts(self):
+        """Test that a waiter taking over the lock skips texts the holder failed"""
+        manager = TranslationMemory.objects
+        digest = translation_digest("Bad text.", "hi", "local")
+        manager._record_failures([digest])
+
+        with fake_backend() as translate_many:
+            (result,) = manager._send_pending(
+                [("hi", {digest: "Bad text."})], None, get_translation_backend()
+            )
+
+        translate_many.assert_not_called()
+        self.assertIsInstance(result[digest], TranslationError)
+        self.assertEqual(cache.get(manager._failure_key(digest))["count"], 1)
+
+    def test_backoff_grows_exponentially(self):
+        """Test that consecutive failures double the backoff"""
+        TranslationMemory.objects._record_failures(["digest"])
+        TranslationMemory.objects._record_failures(["digest"])
+
+        failure = cache.get(TranslationMemory.objects._failure_key("digest"))
+        self.assertEqual(failure["count"], 2)
+        self.assertAlmostEqual(failure["retry_at"] - time.time(), 60, delta=1)
+
+    def test_circuit_opens_after_repeated_failures(self):
+        """Test that an open circuit skips the backend for every text"""
+        for text in ("One.", "Two."):
+            with self.assertRaises(TranslationError):
+                TranslationMemory.objects.translate([text], "hi")
+
+        with mock.patch.object(
+            LocalTranslationBackend, "atranslate_many", autospec=True
+        ) as translate_many:
+            (result,) = translate_concurrently([(["Three."], "hi")])
+
+        translate_many.assert_not_called()
+        self.assertIsInstance(result[0], TranslationError)
+
+        with self.assertRaises(TranslationError):
+            TranslationMemory.objects.translate(["Three."], "hi")
+        # Rejected texts never reached the backend, so they do not back off
+        self.assertFalse(
+            TranslationMemory.objects._in_backoff(
+                [translation_digest("Three.", "hi", "local")]
+            )
+        )
+
+    def test_circuit_closes_after_successful_trial(self):
+        """Test that a successful trial call after the timeout closes the circuit"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertIsNone(breaker.opened_at)
+
+    def test_half_open_circuit_lets_one_batch_through(self):
+        """Test that a half-open circuit sends a single trial batch per request"""
+        breaker = get_circuit_breaker()
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        breaker.opened_at -= breaker.reset_timeout
+
+        with fake_backend() as translate_many:
+            (result,) = translate_concurrently([(["One.", "Two.", "Three."], "hi")], 1)
+
+        self.assertEqual(translate_many.call_count, 1)
+        self.assertEqual(result[0], "hi:One.")
+        for error in result[1:]:
+            self.assertIsInstance(error, TranslationError)
+
+
+@override_settings(FAQ_SETTINGS=LOCAL_FAQ_SETTINGS)
+class WarmTranslationsCommandTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.faqs = [
+            FAQ.objects.create(question=f"Question {i}?", answer=f"Answer {i}.")
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_warms_every_faq_and_language(self):
+        """Test that every FAQ is translated into every configured language"""
+        out = StringIO()
+        call_command("warm_translations", workers=1, batch_size=2, stdout=out)
+
+        self.assertEqual(FAQTranslation.objects.count(), 12)
+        self.assertIn("[3/3]", out.getvalue())
+        with fake_backend() as translate_many:
+            self.faqs[0].get_translated_content("bn")
+        translate_many.assert_not_called()
+
+    def test_id_range_and_language_subset(self):
+        """Test that filters limit the warmed FAQs and languages"""
+        call_command(
+            "warm_translations",
+            languages=["hi"],
+            min_id=self.faqs[1].pk,
+            workers=1,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(
+            set(FAQTranslation.objects.values_list("faq_id", "lang").distinct()),
+            {(self.faqs[1].pk, "hi"), (self.faqs[2].pk, "hi")},
+        )
+
+    def test_failed_batches_are_not_checkpointed(self):
+        """Test that untranslated batches fail the run and are retried on resume"""
+        out = StringIO()
+        with mock.patch.object(
+            FAQTranslation.objects, "translate_batch", return_value=[]
+        ):
+            with self.assertRaises(CommandError):
+                call_command("warm_translations", workers=1, batch_size=2, stdout=out)
+
+        self.assertIn("12 missing", out.getvalue())
+        self.assertNotIn("Warmed", out.getvalue())
+        self.assertIsNone(cache.get(self.faqs[0]._get_cache_key("content", "hi")))
+
+        call_command("warm_translations", resume=True, workers=1, stdout=StringIO())
+        self.assertEqual(FAQTranslation.objects.count(), 12)
+
+    def test_resume_skips_completed_faqs(self):
+        """Test that --resume continues after the last completed batch"""
+        command = WarmTranslationsCommand()
+        options = {
+            "languages": None,
+            "min_id": None,
+            "max_id": None,
+            "updated_since": None,
+            "updated_before": None,
+            "batch_size": 100,
+        }
+        cache.set(command._checkpoint_key(["hi", "bn"], options), self.faqs[1].pk, None)
+
+        call_command("warm_translations", resume=True, workers=1, stdout=StringIO())
+
+        self.assertEqual(
+            set(FAQTranslation.objects.values_list("faq_id", flat=True)),
+            {self.faqs[2].pk},
+        )
+
+
+@override_settings(
+    FAQ_SETTINGS={
+        **LOCAL_FAQ_SETTINGS,
+        "TRANSLATION_RATE_LIMIT": {"RATE": 0.001, "BURST": 2},
+    }
+)
+class TranslationRateLimitTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        get_redis_connection("default").delete("translation_rate_limit:local")
+
+    def tearDown(self):
+        cache.clear()
+        get_redis_connection("default").delete("translation_rate_limit:local")
+
+    def test_bucket_allows_burst_then_rejects(self):
+        """Test that the shared bucket allows up to its burst"""
+        bucket = TokenBucket("translation_rate_limit:local", rate=0.001, burst=2)
+
+        self.assertEqual([bucket.acquire() for _ in range(3)], [True, True, False])
+
+    def test_requests_larger_than_burst_are_split(self):
+        """Test that a request needing more tokens than the burst takes what is left"""
+        bucket = TokenBucket("translation_rate_limit:local", rate=0.001, burst=2)
+
+        self.assertFalse(bucket.acquire(3))
+        self.assertEqual(bucket.acquire_up_to(3), 2)
+        self.assertEqual(bucket.acquire_up_to(3), 0)
+
+    @override_settings(
+        FAQ_SETTINGS={
+            **LOCAL_FAQ_SETTINGS,
+            "TRANSLATION_BACKEND": {
+                "BACKEND": "faqs.translation.LocalTranslationBackend",
+                "OPTIONS": {"MAX_BATCH_SIZE": 1},
+            },
+            "TRANSLATION_RATE_LIMIT": {"RATE": 0.001, "BURST": 2},
+        }
+    )
+    def test_batches_within_budget_are_sent(self):
+        """Test that batches are limited one token each rather than all or none"""
+        (result,) = translate_concurrently([(["One.", "Two.", "Three."], "hi")])
+
+        self.assertEqual(result[:2], ["[hi] One.", "[hi] Two."])
+        self.assertIsInstance(result[2], TranslationRateLimited)
+
+    def test_over_budget_falls_back_immediately(self):
+        """Test that requests over budget fail fast without backoff"""
+        translate_concurrently([(["One."], "hi"), (["Two."], "bn")])
+
+        with fake_backend() as translate_many:
+            (result,) = translate_concurrently([(["Three."], "hi")])
+        translate_many.assert_not_called()
+        self.assertIsInstance(result[0], TranslationRateLimited)
+
+        faq = FAQ.objects.create(question="Four?", answer="Four.")
+        self.assertEqual(faq.get_translated_content("hi")["question"], "Four?")
+        self.assertFalse(
+            TranslationMemory.objects._in_backoff(
+                [translation_digest("Four?", "hi", "local")]
+            )
+        )
+
+
+class HedgedTranslationBackendTests(TestCase):
+    def test_slow_primary_is_hedged(self):
+        """Test that the secondary answers when the primary is slow"""
+        backend = HedgedTranslationBackend(
+            [LocalTranslationBackend(latency=2), CountingBackend("secondary")],
+            default_delay=0.05,
+        )
+        started = time.monotonic()
+
+        self.assertEqual(backend.translate_many(["a"], "hi"), ["secondary:a"])
+        self.assertLess(time.monotonic() - started, 1)
+        # The cancelled primary call still counts towards its latency
+        self.assertEqual(len(backend.histograms[0]), 1)
+        self.assertGreaterEqual(backend.histograms[0].percentile(100), 0.05)
+
+    def test_fast_primary_is_not_hedged(self):
+        """Test that no secondary call is made when the primary is fast"""
+        secondary = CountingBackend("secondary")
+        backend = HedgedTranslationBackend(
+            [LocalTranslationBackend(), secondary], default_delay=0.5
+        )
+
+        self.assertEqual(backend.translate_many(["a"], "hi"), ["[hi] a"])
+        self.assertEqual(secondary.calls, 0)
+
+    def test_failed_primary_falls_through(self):
+        """Test that a failing primary is replaced immediately"""
+        backend = HedgedTranslationBackend(
+            [LocalTranslationBackend(error_rate=1), CountingBackend("secondary")],
+            default_delay=5,
+        )
+
+        self.assertEqual(backend.translate_many(["a"], "hi"), ["secondary:a"])
+
+    def test_hedge_delay_adapts_to_latency(self):
+        """Test that the hedge delay follows the primary's latency percentile"""
+        backend = HedgedTranslationBackend(
+            [LocalTranslationBackend(), CountingBackend("secondary")],
+            percentile=90,
+            min_samples=10,
+        )
+        for latency in range(1, 11):
+            backend.histograms[0].record(latency / 100)
+
+        self.assertAlmostEqual(backend.hedge_delay(0), 0.1)
+
+
+class CountingBackend(BaseTranslationBackend):
+    """Backend that tags texts with its name and counts its calls"""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.calls = 0
+
+    def translate_many(self, texts, lang):
+        self.calls += 1
+        return [f"{self.name}:{text}" for text in texts]
@@ -0,0 +1,528 @@
+import abc
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .ratelimit import get_translation_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRANSLATION_BACKEND = {
+    "BACKEND": "faqs.translation.GoogleTransBackend",
+    "OPTIONS": {},
+}
+
+_backend = None
+_executor = None
+_circuit_breaker = None
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class TranslationError(Exception):
+    """Raised when a translation backend fails to translate."""
+
+
+class TranslationRateLimited(TranslationError):
+    """Raised when the shared outbound translation budget is exhausted."""
+
+
+class TranslationCircuitOpen(TranslationError):
+    """Raised when calls are rejected because the backend keeps failing."""
+
+
+class BaseTranslationBackend(abc.ABC):
+    """
+    Base class for translation backends.
+
+    Subclasses implement ``translate_many``; ``max_batch_size`` and
+    ``max_batch_chars`` tell callers how many texts, and how many characters
+    in total, may be sent in a single call.
+    """
+
+    name = None
+    max_batch_size = 50
+    max_batch_chars = None
+
+    def __init__(self, max_batch_size=None, max_batch_chars=None):
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if max_batch_chars is not None:
+            self.max_batch_chars = max_batch_chars
+
+    @abc.abstractmethod
+    def translate_many(self, texts, lang):
+        """
+        Translate texts into the target language.
+
+        Args:
+            texts (list): Source texts, at most ``max_batch_size`` of them
+            lang (str): Target language code
+
+        Returns:
+            list: Translated texts in the same order
+
+        Raises:
+            TranslationError: If the backend fails
+        """
+
+    def translate(self, text, lang):
+        """Translate a single text into the target language."""
+        return self.translate_many([text], lang)[0]
+
+    async def atranslate_many(self, texts, lang):
+        """
+        Asynchronous ``translate_many``.
+
+        The default runs the synchronous implementation on a shared thread
+        pool; backends with a native async client should override it.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_executor(), self.translate_many, texts, lang
+        )
+
+
+class GoogleTransBackend(BaseTranslationBackend):
+    """Translation backend using the googletrans web client."""
+
+    name = "googletrans"
+    max_batch_chars = 5000
+
+    def translate_many(self, texts, lang):
+        from googletrans import Translator
+
+        try:
+            translations = Translator().translate(list(texts), dest=lang)
+        except Exception as e:
+            raise TranslationError(str(e)) from e
+        return [translation.text for translation in translations]
+
+
+class LocalTranslationBackend(BaseTranslationBackend):
+    """
+    Deterministic offline backend for tests and benchmarks.
+
+    Prefixes each text with the language code. Latency is simulated per call
+    and failures are chosen from a digest of the input, so the same texts
+    always succeed or fail the same way.
+    """
+
+    name = "local"
+    max_batch_size = 100
+
+    def __init__(
+        self,
+        latency=0,
+        error_rate=0,
+        seed="",
+        max_batch_size=None,
+        max_batch_chars=None,
+    ):
+        super().__init__(max_batch_size=max_batch_size, max_batch_chars=max_batch_chars)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+
+    def _should_fail(self, texts, lang):
+        if not self.error_rate:
+            return False
+        payload = "\x00".join([self.seed, lang, *texts]).encode("utf-8")
+        digest = hashlib.sha256(payload).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64 < self.error_rate
+
+    def _translate(self, texts, lang):
+        if self._should_fail(texts, lang):
+            raise TranslationError(f"Simulated failure for language {lang}")
+        return [f"[{lang}] {text}" for text in texts]
+
+    def translate_many(self, texts, lang):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._translate(texts, lang)
+
+    async def atranslate_many(self, texts, lang):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._translate(texts, lang)
+
+
+class CircuitBreaker:
+    """
+    Process-wide circuit breaker for translation backend calls.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are rejected without reaching the backend. Once ``reset_timeout``
+    seconds have passed a single trial call is let through; its success
+    closes the circuit again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return whether a backend call may be made now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Half-open: re-arm the timer so only one trial goes through
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning("Translation backend failing, opening circuit")
+                self.opened_at = time.monotonic()
+
+
+def get_circuit_breaker():
+    """Return the circuit breaker guarding the translation backend."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+        _circuit_breaker = CircuitBreaker(
+            failure_threshold=faq_settings.get("CIRCUIT_BREAKER_THRESHOLD", 5),
+            reset_timeout=faq_settings.get("CIRCUIT_BREAKER_RESET_TIMEOUT", 30),
+        )
+    return _circuit_breaker
+
+
+class LatencyHistogram:
+    """Rolling window of recent call latencies for one backend."""
+
+    def __init__(self, size=500):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percent):
+        """Return the latency below which ``percent`` of recent calls finished."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percent / 100))
+        return samples[index]
+
+
+class HedgedTranslationBackend(BaseTranslationBackend):
+    """
+    Sends each call to an ordered list of backends with hedging.
+
+    The primary backend is called first. If it has not answered within the
+    configured percentile of its recent latencies, the next backend is called
+    as well, and the first successful answer wins. Until enough samples have
+    been collected ``default_delay`` is used as the hedge delay.
+    """
+
+    def __init__(self, backends, percentile=95, default_delay=0.5, min_samples=20):
+        limits = [
+            backend.max_batch_chars for backend in backends if backend.max_batch_chars
+        ]
+        super().__init__(
+            max_batch_size=min(backend.max_batch_size for backend in backends),
+            max_batch_chars=min(limits, default=None),
+        )
+        self.backends = backends
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self.histograms = [LatencyHistogram() for _ in backends]
+        self.name = "+".join(backend.name for backend in backends)
+
+    def hedge_delay(self, index):
+        """Return how long to wait for the backend at ``index`` before hedging."""
+        histogram = self.histograms[index]
+        if len(histogram) < self.min_samples:
+            return self.default_delay
+        return histogram.percentile(self.percentile)
+
+    async def _timed(self, index, texts, lang):
+        started = time.monotonic()
+        try:
+            return await self.backends[index].atranslate_many(texts, lang)
+        finally:
+            # Calls cancelled by a winning hedge or failing took at least this
+            # long; leaving them out would hide the slow tail
+            self.histograms[index].record(time.monotonic() - started)
+
+    async def atranslate_many(self, texts, lang):
+        pending = set()
+        error = None
+        for index in range(len(self.backends)):
+            pending.add(asyncio.ensure_future(self._timed(index, texts, lang)))
+            is_last = index == len(self.backends) - 1
+            timeout = None if is_last else self.hedge_delay(index)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        for other in pending:
+                            other.cancel()
+                        return task.result()
+                    error = task.exception()
+                if not done or not is_last:
+                    # Hedge delay passed or a call failed: try the next backend
+                    break
+
+        raise TranslationError(f"All translation backends failed: {error}")
+
+    def translate_many(self, texts, lang):
+        return run_sync(self.atranslate_many(texts, lang))
+
+
+def _load_backend(config):
+    backend_cls = import_string(config["BACKEND"])
+    options = {key.lower(): value for key, value in config.get("OPTIONS", {}).items()}
+    return backend_cls(**options)
+
+
+def get_translation_backend():
+    """
+    Return the configured translation backend instance.
+
+    Configured through ``FAQ_SETTINGS["TRANSLATION_BACKEND"]``, a dict with a
+    dotted ``BACKEND`` path and backend ``OPTIONS``. When an ordered list of
+    such dicts is set in ``TRANSLATION_BACKENDS`` instead, calls are hedged
+    across them using the ``TRANSLATION_HEDGE`` options.
+    """
+    global _backend
+    if _backend is None:
+        faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+        configs = faq_settings.get("TRANSLATION_BACKENDS")
+        if configs and len(configs) > 1:
+            hedge = faq_settings.get("TRANSLATION_HEDGE", {})
+            _backend = HedgedTranslationBackend(
+                [_load_backend(config) for config in configs],
+                **{key.lower(): value for key, value in hedge.items()},
+            )
+        else:
+            _backend = _load_backend(
+                configs[0]
+                if configs
+                else faq_settings.get(
+                    "TRANSLATION_BACKEND", DEFAULT_TRANSLATION_BACKEND
+                )
+            )
+    return _backend
+
+
+def normalize_text(text):
+    """Normalize unicode form and whitespace so equivalent texts share a digest."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def translation_digest(text, lang, backend_name):
+    """
+    Return the content address of a translation.
+
+    Unlike ``hash()``, the digest is stable across processes and restarts.
+    """
+    payload = "\x00".join([backend_name, lang, normalize_text(text)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_executor():
+    """Return the thread pool used to run synchronous backends concurrently."""
+    global _executor
+    if _executor is None:
+        concurrency = getattr(settings, "FAQ_SETTINGS", {}).get(
+            "TRANSLATION_CONCURRENCY", 8
+        )
+        _executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="translation"
+        )
+    return _executor
+
+
+def run_sync(coroutine):
+    """Run a coroutine from synchronous code, e.g. a WSGI view."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # Called from inside an event loop: run on a separate thread and loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def split_batches(texts, batch_size, max_chars=None):
+    """
+    Split texts into batches of at most ``batch_size`` texts.
+
+    With ``max_chars`` a batch is also closed once its texts add up to that
+    many characters, so the chunks of one long document are sent as separate
+    calls that run in parallel. A text longer than ``max_chars`` gets a batch
+    of its own.
+    """
+    batches = []
+    batch = []
+    size = 0
+    for text in texts:
+        if batch and (
+            len(batch) >= batch_size or (max_chars and size + len(text) > max_chars)
+        ):
+            batches.append(batch)
+            batch = []
+            size = 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def atranslate_concurrently(requests, batch_size=None):
+    """
+    Translate several ``(texts, lang)`` requests at once.
+
+    Every request is split into backend-sized batches, by count and by
+    characters (``TRANSLATION_MAX_BATCH_CHARS``), and all batches are
+    sent concurrently, capped by ``TRANSLATION_CONCURRENCY``. Batches still
+    running after ``TRANSLATION_DEADLINE`` seconds are abandoned.
+
+    Returns:
+        list: Per request, the translated texts, with the ``TranslationError``
+        that prevented a text's batch in its place
+    """
+    faq_settings = getattr(settings, "FAQ_SETTINGS", {})
+    concurrency = faq_settings.get("TRANSLATION_CONCURRENCY", 8)
+    deadline = faq_settings.get("TRANSLATION_DEADLINE", 10)
+    backend = get_translation_backend()
+    if batch_size is None or batch_size > backend.max_batch_size:
+        batch_size = backend.max_batch_size
+    max_chars = faq_settings.get("TRANSLATION_MAX_BATCH_CHARS", backend.max_batch_chars)
+
+    requests = [(list(texts), lang) for texts, lang in requests]
+    breaker = get_circuit_breaker()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(texts, lang):
+        async with semaphore:
+            try:
+                result = await backend.atranslate_many(texts, lang)
+            except Exception:
+                breaker.record_failure()
+                raise
+            breaker.record_success()
+            return result
+
+    limiter = get_translation_rate_limiter(backend.name)
+    results = [[] for _ in requests]
+    tasks = []
+    for index, (texts, lang) in enumerate(requests):
+        chunks = split_batches(texts, batch_size, max_chars)
+        # The breaker is asked per batch, so a half-open circuit lets a single
+        # trial batch through rather than the whole request
+        allowed = 0
+        while allowed < len(chunks) and breaker.allow():
+            allowed += 1
+        # Each batch takes a token; batches over budget fail fast so callers
+        # serve cached or English content
+        granted = allowed
+        if limiter is not None and allowed:
+            granted = limiter.acquire_up_to(allowed)
+        for position, chunk in enumerate(chunks):
+            if position < granted:
+                task = asyncio.ensure_future(run(chunk, lang))
+            elif position < allowed:
+                task = TranslationRateLimited(
+                    f"Translation rate limit exceeded for language {lang}"
+                )
+            else:
+                task = TranslationCircuitOpen("Translation backend circuit is open")
+            tasks.append((index, chunk, task))
+
+    futures = [task for _, _, task in tasks if isinstance(task, asyncio.Future)]
+    pending = set()
+    if futures:
+        _, pending = await asyncio.wait(futures, timeout=deadline)
+    for task in pending:
+        task.cancel()
+        breaker.record_failure()
+
+    # Batches of a request were created in order, so results line up with texts
+    for index, chunk, task in tasks:
+        if isinstance(task, TranslationError):
+            error = task
+        elif task in pending:
+            error = TranslationError("Translation deadline exceeded")
+        elif task.exception() is not None:
+            error = task.exception()
+            if not isinstance(error, TranslationError):
+                error = TranslationError(str(error))
+        else:
+            results[index] += task.result()
+            continue
+        results[index] += [error] * len(chunk)
+    return results
+
+
+def translate_concurrently(requests, batch_size=None):
+    """Synchronous wrapper around ``atranslate_concurrently``."""
+    return run_sync(atranslate_concurrently(requests, batch_size))
+
+
+def translate_many(texts, lang):
+    """
+    Translate texts, splitting them into concurrent backend-sized batches.
+
+    Raises:
+        TranslationError: If any batch fails
+    """
+    (result,) = translate_concurrently([(texts, lang)])
+    return raise_first_error(result)
+
+
+def raise_first_error(results):
+    """Return per-text results, raising the first error among them."""
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+@receiver(setting_changed)
+def reset_translation_backend(*, setting, **kwargs):
+    """Drop the cached backend when FAQ settings change (e.g. in tests)."""
+    global _backend, _executor, _circuit_breaker
+    if setting == "FAQ_SETTINGS":
+        _backend = None
+        _circuit_breaker = None
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
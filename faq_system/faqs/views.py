@@ -1,4 +1,5 @@
 from functools import wraps
+import json
 
 from django.conf import settings
 from django.contrib import messages
@@ -6,35 +7,147 @@ from django.contrib.auth.decorators import login_required
 from django.core.cache import cache
 from django.db import transaction
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.utils.decorators import method_decorator
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from .caching import (
+    faq_namespace,
+    get_last_modified,
+    get_or_set_stale,
+    lang_namespace,
+    tag_many,
+    versioned_key,
+    versioned_keys,
+)
 from .forms import FAQForm
-from .models import FAQ
+from .models import FAQ, FAQTranslation
+from .purge import faq_surrogate_key, lang_surrogate_key, LIST_SURROGATE_KEY
+from .responses import (
+    entry_body,
+    json_response,
+    make_etag,
+    mark_uncacheable,
+    patch_proxy_headers,
+    render_json,
+)
 from .serializers import FAQSerializer
 
 
-def get_cache_key(prefix, identifier=None, lang="en"):
-    """Generate cache key for FAQ-related data."""
+def get_cache_tags(identifier=None, lang="en"):
+    """Return the namespaces that invalidate FAQ-related data."""
     if identifier:
-        return f"faq:{prefix}:{identifier}:{lang}"
-    return f"faq:{prefix}:{lang}"
+        return [faq_namespace(identifier), lang_namespace(lang)]
+    return ["list", lang_namespace(lang)]
 
 
-def clear_faq_cache(func):
-    """Decorator to clear all FAQ-related caches after data modifications."""
+def get_cache_key(prefix, identifier=None, lang="en", create=True):
+    """
+    Generate cache key for FAQ-related data.
+
+    Keys include the generations of the FAQ list or the FAQ itself and of the
+    language, so invalidation only needs to bump a counter. With
+    ``create=False`` the key is ``None`` until the counters exist.
+    """
+    tags = get_cache_tags(identifier, lang)
+    if identifier:
+        return versioned_key(f"faq:{prefix}:{identifier}:{lang}", *tags, create=create)
+    return versioned_key(f"faq:{prefix}:{lang}", *tags, create=create)
+
+
+def get_validator_language(request, pk=None):
+    """
+    Return the language to compute validators for, or ``None`` to skip them.
+
+    Validators are computed before the view validates anything, so only
+    configured languages and numeric ids get them; other values would leave
+    version counters behind for every request.
+    """
+    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "LANGUAGES", ["en", "hi", "bn"]
+    )
+    lang = request.GET.get("lang", "en")
+    if lang not in languages or (pk is not None and not str(pk).isdigit()):
+        return None
+    return lang
+
+
+def list_etag(request, *args, **kwargs):
+    """ETag of the API list, derived from the corpus and language versions."""
+    lang = get_validator_language(request)
+    return lang and make_etag(get_cache_key("api_list", lang=lang))
+
+
+def list_last_modified(request, *args, **kwargs):
+    lang = get_validator_language(request)
+    return lang and get_last_modified(get_cache_tags(lang=lang))
+
+
+def detail_etag(request, pk, *args, **kwargs):
+    """
+    ETag of a single FAQ, derived from the FAQ and language versions.
+
+    The FAQ's counter is only created by the view once the FAQ is found, so
+    requests for ids that do not exist leave nothing behind.
+    """
+    lang = get_validator_language(request, pk)
+    key = lang and get_cache_key("api_detail", pk, lang, create=False)
+    return key and make_etag(key)
+
+
+def detail_last_modified(request, pk, *args, **kwargs):
+    lang = get_validator_language(request, pk)
+    return lang and get_last_modified(get_cache_tags(pk, lang))
+
+
+def page_etag(request, *args, **kwargs):
+    """ETag of the FAQ page; signed-in users get uncached, personalised pages."""
+    lang = get_validator_language(request)
+    if request.user.is_authenticated or lang is None:
+        return None
+    return make_etag(get_cache_key("page", lang=lang))
+
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
-        cache_keys = cache.keys("faq:*")
-        if cache_keys:
-            cache.delete_many(cache_keys)
-        return result
+def page_last_modified(request, *args, **kwargs):
+    if request.user.is_authenticated:
+        return None
+    return list_last_modified(request)
 
-    return wrapper
+
+def list_surrogate_keys(request, *args, **kwargs):
+    return [LIST_SURROGATE_KEY, lang_surrogate_key(request.GET.get("lang", "en"))]
+
+
+def detail_surrogate_keys(request, pk, *args, **kwargs):
+    return [faq_surrogate_key(pk), lang_surrogate_key(request.GET.get("lang", "en"))]
+
+
+def proxy_cacheable(surrogate_keys_func):
+    """
+    Decorator adding proxy cache headers to successful and 304 responses.
+
+    Applied outside ``condition`` so not-modified responses carry them too.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                patch_proxy_headers(
+                    request, response, surrogate_keys_func(request, *args, **kwargs)
+                )
+            return response
+
+        return wrapper
+
+    return decorator
 
 
 class FAQViewSet(viewsets.ModelViewSet):
@@ -47,47 +160,89 @@ class FAQViewSet(viewsets.ModelViewSet):
     serializer_class = FAQSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        """Prefetch stored translations for the requested language."""
+        queryset = super().get_queryset()
+        lang = self.request.query_params.get("lang", "en")
+        if lang != "en":
+            queryset = queryset.with_translations(lang)
+        return queryset
+
     def get_serializer_context(self):
         """Add language preference to serializer context."""
         context = super().get_serializer_context()
         context["lang"] = self.request.query_params.get("lang", "en")
         return context
 
+    def cached_response(self, entry):
+        """
+        Return a cached JSON entry as is.
+
+        Clients negotiating another renderer, such as the browsable API, get a
+        regular response built from the cached JSON.
+        """
+        if not isinstance(self.request.accepted_renderer, JSONRenderer):
+            return Response(json.loads(entry_body(entry)))
+        return json_response(self.request, entry)
+
+    @method_decorator(proxy_cacheable(list_surrogate_keys))
+    @method_decorator(condition(list_etag, list_last_modified))
     def list(self, request, *args, **kwargs):
         """List FAQs with caching support for each language."""
         lang = request.query_params.get("lang", "en")
-        cache_key = get_cache_key("list", lang=lang)
+        cache_key = get_cache_key("api_list", lang=lang)
+
+        def compute():
+            queryset = self.filter_queryset(self.get_queryset())
+            if lang != "en":
+                queryset = list(queryset)
+                FAQTranslation.objects.translate_missing(queryset, [lang])
+            return render_json(
+                self.get_serializer(queryset, many=True).data, make_etag(cache_key)
+            )
 
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return Response(cached_data)
+        used_fallback = False
 
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        data = serializer.data
+        def fallback():
+            # Another request is still translating: serve English, uncached
+            nonlocal used_fallback
+            used_fallback = True
+            queryset = self.filter_queryset(self.get_queryset())
+            context = {**self.get_serializer_context(), "lang": "en"}
+            return render_json(
+                self.get_serializer(queryset, many=True, context=context).data
+            )
 
         timeout = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_TIMEOUT", 60 * 60)
-        cache.set(cache_key, data, timeout=timeout)
-        return Response(data)
+        response = self.cached_response(
+            get_or_set_stale(
+                cache_key,
+                compute,
+                timeout,
+                fallback=fallback if lang != "en" else None,
+                tags=["list"],
+            )
+        )
+        return mark_uncacheable(response) if used_fallback else response
 
+    @method_decorator(proxy_cacheable(detail_surrogate_keys))
+    @method_decorator(condition(detail_etag, detail_last_modified))
     def retrieve(self, request, *args, **kwargs):
         """Retrieve single FAQ with language-specific caching."""
         lang = request.query_params.get("lang", "en")
         instance = self.get_object()
-        cache_key = get_cache_key("detail", instance.pk, lang)
-
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return Response(cached_data)
+        cache_key = get_cache_key("api_detail", instance.pk, lang)
 
-        serializer = self.get_serializer(instance)
-        data = serializer.data
+        def compute():
+            return render_json(self.get_serializer(instance).data, make_etag(cache_key))
 
         timeout = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_TIMEOUT", 60 * 60)
-        cache.set(cache_key, data, timeout=timeout)
-        return Response(data)
+        return self.cached_response(
+            get_or_set_stale(
+                cache_key, compute, timeout, tags=[faq_namespace(instance.pk)]
+            )
+        )
 
-    @clear_faq_cache
     def create(self, request, *args, **kwargs):
         """Create FAQ with automatic cache clearing."""
         serializer = self.get_serializer(data=request.data)
@@ -100,7 +255,6 @@ class FAQViewSet(viewsets.ModelViewSet):
                 )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @clear_faq_cache
     def update(self, request, *args, **kwargs):
         """Update FAQ with automatic cache clearing."""
         partial = kwargs.pop("partial", False)
@@ -113,7 +267,6 @@ class FAQViewSet(viewsets.ModelViewSet):
                 return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @clear_faq_cache
     def destroy(self, request, *args, **kwargs):
         """Delete FAQ with automatic cache clearing."""
         instance = self.get_object()
@@ -121,7 +274,6 @@ class FAQViewSet(viewsets.ModelViewSet):
             self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-    @clear_faq_cache
     @action(detail=False, methods=["post"])
     def bulk_create(self, request):
         """Create multiple FAQs in a single request."""
@@ -139,37 +291,90 @@ class FAQViewSet(viewsets.ModelViewSet):
 def get_faqs_with_translations(lang):
     """
     Retrieve all FAQs with translations for specified language.
-    Uses caching to improve performance.
+    Uses caching to improve performance; while another request is translating
+    the list, waiters past ``SINGLE_FLIGHT_WAIT`` get the English list.
+
+    Returns:
+        tuple: The FAQ dicts and the language they are actually in
     """
-    cache_key = f"faq:list_data:{lang}"
-    cached_data = cache.get(cache_key)
+    served = lang
 
-    if cached_data is None:
+    def compute():
         faqs = FAQ.objects.all().order_by("-created_at")
-        translated_faqs = [
-            {"id": faq.id, **faq.get_translated_content(lang)} for faq in faqs
-        ]
+        if lang != "en":
+            faqs = list(faqs.with_translations(lang))
+            FAQTranslation.objects.translate_missing(faqs, [lang])
+        return [{"id": faq.id, **faq.get_translated_content(lang)} for faq in faqs]
+
+    def fallback():
+        nonlocal served
+        faqs, served = get_faqs_with_translations("en")
+        return faqs
+
+    timeout = getattr(settings, "FAQ_SETTINGS", {}).get("CACHE_TIMEOUT", 60 * 60 * 24)
+    faqs = get_or_set_stale(
+        get_cache_key("list_data", lang=lang),
+        compute,
+        timeout,
+        fallback=fallback if lang != "en" else None,
+        tags=["list"],
+    )
+    return faqs, served
 
+
+def render_faq_fragments(request, faqs, lang):
+    """
+    Render each FAQ's HTML block, reusing cached fragments.
+
+    Fragments are cached per FAQ, language, FAQ version and sign-in state and
+    fetched with a single multi-get, so after an edit only the changed FAQ
+    is rendered again.
+    """
+    authenticated = request.user.is_authenticated
+    tags_by_key = {}
+    namespaces_by_key = {}
+    for faq in faqs:
+        key = f"faq:fragment:{faq['id']}:{lang}:{int(authenticated)}"
+        namespaces_by_key[key] = get_cache_tags(faq["id"], lang)
+    keys = versioned_keys(namespaces_by_key)
+    cached = cache.get_many(keys.values())
+
+    fragments = []
+    rendered = {}
+    for faq, (key, cache_key) in zip(faqs, keys.items()):
+        fragment = cached.get(cache_key)
+        if fragment is None:
+            fragment = render_to_string(
+                "faqs/faq_item.html", {"faq": faq, "user": request.user}
+            )
+            rendered[cache_key] = fragment
+            tags_by_key[cache_key] = [faq_namespace(faq["id"])]
+        fragments.append(mark_safe(fragment))
+
+    if rendered:
         timeout = getattr(settings, "FAQ_SETTINGS", {}).get(
             "CACHE_TIMEOUT", 60 * 60 * 24
         )
-        cache.set(cache_key, translated_faqs, timeout=timeout)
-        return translated_faqs
-
-    return cached_data
+        cache.set_many(rendered, timeout=timeout)
+        tag_many(tags_by_key, timeout)
+    return fragments
 
 
+@proxy_cacheable(list_surrogate_keys)
+@condition(page_etag, page_last_modified)
 def faq_list(request):
     """Display list of FAQs with language selection support."""
     lang = request.GET.get("lang", "en")
-    translated_faqs = get_faqs_with_translations(lang)
+    translated_faqs, served_lang = get_faqs_with_translations(lang)
 
     context = {
-        "faqs": translated_faqs,
+        # Fragments are cached under the language they were rendered in
+        "faq_fragments": render_faq_fragments(request, translated_faqs, served_lang),
         "current_lang": lang,
         "available_languages": [("en", "English"), ("hi", "Hindi"), ("bn", "Bengali")],
     }
-    return render(request, "faqs/faq_list.html", context)
+    response = render(request, "faqs/faq_list.html", context)
+    return mark_uncacheable(response) if served_lang != lang else response
 
 
 @login_required
@@ -181,22 +386,6 @@ def faq_create(request):
             with transaction.atomic():
                 form.save()
 
-                languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-                    "LANGUAGES", ["en", "hi", "bn"]
-                )
-                cache_keys = []
-
-                for lang in languages:
-                    cache_keys.extend(
-                        [
-                            get_cache_key("list", lang=lang),
-                            get_cache_key("list_data", lang=lang),
-                        ]
-                    )
-
-                if cache_keys:
-                    cache.delete_many(cache_keys)
-
                 messages.success(request, "FAQ created successfully!")
                 return redirect("faq_list")
     else:
@@ -208,7 +397,10 @@ def faq_create(request):
 @login_required
 def faq_edit(request, pk):
     """Edit FAQ with translation preview and cache management."""
-    faq = get_object_or_404(FAQ, pk=pk)
+    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "LANGUAGES", ["en", "hi", "bn"]
+    )
+    faq = get_object_or_404(FAQ.objects.with_translations(languages), pk=pk)
 
     if request.method == "POST":
         form = FAQForm(request.POST, instance=faq)
@@ -218,32 +410,13 @@ def faq_edit(request, pk):
                 faq.save()
                 form.save_m2m()
 
-                languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-                    "LANGUAGES", ["en", "hi", "bn"]
-                )
-                cache_keys = []
-
-                for lang in languages:
-                    cache_keys.extend(
-                        [
-                            get_cache_key("list", lang=lang),
-                            get_cache_key("list_data", lang=lang),
-                            get_cache_key("detail", faq.pk, lang),
-                        ]
-                    )
-
-                if cache_keys:
-                    cache.delete_many(cache_keys)
-
                 messages.success(request, "FAQ updated successfully!")
                 return redirect("faq_list")
     else:
         form = FAQForm(instance=faq)
 
     translations = {}
-    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-        "LANGUAGES", ["en", "hi", "bn"]
-    )
+    FAQTranslation.objects.translate_missing([faq], languages)
     for lang in languages:
         if lang != "en":
             translations[lang] = faq.get_translated_content(lang)
@@ -268,36 +441,20 @@ def faq_edit(request, pk):
 @login_required
 def faq_delete(request, pk):
     """Delete FAQ with translation preview and cache clearing."""
-    faq = get_object_or_404(FAQ, pk=pk)
+    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
+        "LANGUAGES", ["en", "hi", "bn"]
+    )
+    faq = get_object_or_404(FAQ.objects.with_translations(languages), pk=pk)
 
     if request.method == "POST":
         with transaction.atomic():
-            languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-                "LANGUAGES", ["en", "hi", "bn"]
-            )
-            cache_keys = []
-
-            for lang in languages:
-                cache_keys.extend(
-                    [
-                        get_cache_key("list", lang=lang),
-                        get_cache_key("list_data", lang=lang),
-                        get_cache_key("detail", faq.pk, lang),
-                    ]
-                )
-
-            if cache_keys:
-                cache.delete_many(cache_keys)
-
             faq.delete()
 
             messages.success(request, "FAQ deleted successfully!")
             return redirect("faq_list")
 
     translations = {}
-    languages = getattr(settings, "FAQ_SETTINGS", {}).get(
-        "LANGUAGES", ["en", "hi", "bn"]
-    )
+    FAQTranslation.objects.translate_missing([faq], languages)
     for lang in languages:
         if lang != "en":
             translations[lang] = faq.get_translated_content(lang)